@@ -0,0 +1,96 @@
+import time
+
+from PySide6.QtCore import QTimer
+
+from .common import get_app, report
+from pyside_wrapper_yaboiteedoh.components import TAction, TWatchdog
+
+
+TRIGGERS = 10
+REPEATS = 30
+REPEAT_INTERVAL = 10
+
+
+def crunch():
+    return sum(i * i for i in range(1_000_000))
+
+
+def wait_for(app, action, timeout=30):
+    deadline = time.perf_counter() + timeout
+    while (action.running or action._queued) and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def responsiveness(app, executor):
+    action = TAction('crunch', func=crunch, executor=executor)
+    if executor is not None:
+        action.ping()
+        wait_for(app, action)
+
+    watchdog = TWatchdog(threshold=100).start()
+    start = time.perf_counter()
+    for i in range(TRIGGERS):
+        QTimer.singleShot(i * 20, action.ping)
+    app.processEvents()
+    time.sleep(0.001)
+    while time.perf_counter() - start < TRIGGERS * 0.02:
+        app.processEvents()
+        time.sleep(0.001)
+    wait_for(app, action)
+    elapsed = time.perf_counter() - start
+    watchdog.stop()
+    result = watchdog.report()
+    return elapsed, result['max_ms'], len(result['stalls'])
+
+
+def held_shortcut(app, **kwargs):
+    runs = []
+
+    def callback():
+        runs.append(1)
+        time.sleep(0.03)
+
+    action = TAction('held', func=callback, **kwargs)
+    results = []
+    action.finished.connect(results.append)
+
+    for _ in range(REPEATS):
+        action.ping()
+        deadline = time.perf_counter() + REPEAT_INTERVAL / 1000
+        while time.perf_counter() < deadline:
+            app.processEvents()
+    wait_for(app, action)
+    return len(runs), len(results)
+
+
+def main():
+    app = get_app()
+    rows = []
+    for name, executor in [('inline', None), ('thread', 'thread'), ('process', 'process')]:
+        elapsed, worst, stalls = responsiveness(app, executor)
+        rows.append([name, f'{elapsed * 1000:.0f}', f'{worst:.1f}', stalls])
+    report(
+        f'{TRIGGERS} CPU-bound callbacks triggered 20 ms apart',
+        rows,
+        ['executor', 'total ms', 'worst frame ms', 'stalls > 100 ms']
+    )
+
+    rows = []
+    for name, kwargs in [
+        ('thread, queue', {'executor': 'thread', 'reentrancy': 'queue'}),
+        ('thread, drop', {'executor': 'thread', 'reentrancy': 'drop'}),
+        ('thread, cancel', {'executor': 'thread', 'reentrancy': 'cancel'}),
+        ('thread, queue, throttle 100', {'executor': 'thread', 'throttle': 100}),
+        ('inline, throttle 100', {'throttle': 100})
+    ]:
+        rows.append([name, *held_shortcut(app, **kwargs)])
+    report(
+        f'{REPEATS} auto-repeat triggers {REPEAT_INTERVAL} ms apart on a 30 ms callback',
+        rows,
+        ['mode', 'callbacks run', 'results delivered']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+from PySide6.QtWidgets import QMainWindow
+
+from .common import get_app, settle, timed, report
+from pyside_wrapper_yaboiteedoh.components import TAction, TActionRegistry
+
+
+SIZES = [100, 500, 2_000]
+MENUS = 20
+SHORTCUT_EVERY = 5
+LOOKUPS = 10_000
+
+
+def noop():
+    pass
+
+
+def shortcut(index):
+    first, second = divmod(index, 26)
+    return f'Ctrl+K, Ctrl+{chr(65 + first)}, Ctrl+{chr(65 + second)}'
+
+
+def table(size):
+    return {
+        f'command.{i}': {
+            'text': f'Command {i}',
+            'func': noop,
+            'menu': f'Menu {i % MENUS}',
+            **(
+                {'shortcut': shortcut(i // SHORTCUT_EVERY)}
+                if i % SHORTCUT_EVERY == 0 else {}
+            )
+        }
+        for i in range(size)
+    }
+
+
+def eager(window, specs):
+    menus = {}
+    for spec in specs.values():
+        menu = menus.get(spec['menu'])
+        if menu is None:
+            menu = menus[spec['menu']] = window.menuBar().addMenu(spec['menu'])
+        TAction(
+            spec['text'],
+            func=spec['func'],
+            shortcut=spec.get('shortcut'),
+            parent=menu
+        )
+
+
+def open_menus(registry):
+    for menu in list(registry.menus.values()):
+        menu.aboutToShow.emit()
+
+
+def lookups(registry, names):
+    for i in range(LOOKUPS):
+        registry.find(shortcut(i % 20))
+        registry.action(names[i % len(names)])
+
+
+def main():
+    app = get_app()
+    rows = []
+    for size in SIZES:
+        specs = table(size)
+
+        window = QMainWindow()
+        build, _ = timed(eager, window, specs)
+        window.deleteLater()
+        settle(app)
+
+        window = QMainWindow()
+        registry = TActionRegistry(window)
+        declare, _ = timed(registry.declare, specs)
+        built = len(registry.actions)
+        first_open, _ = timed(open_menus, registry)
+        lookup, _ = timed(lookups, registry, list(specs))
+        window.deleteLater()
+        settle(app)
+
+        rows.append([
+            size,
+            f'{build * 1000:.2f}',
+            f'{declare * 1000:.2f}',
+            built,
+            f'{first_open * 1000:.2f}',
+            f'{lookup / LOOKUPS * 1e6:.2f}'
+        ])
+    report(
+        f'declaring actions in {MENUS} menus, every {SHORTCUT_EVERY}th with a shortcut (ms)',
+        rows,
+        ['actions', 'eager', 'declare', 'built', 'open all menus', 'lookup us']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import tracemalloc
+
+from PySide6.QtWidgets import QLabel
+
+from .common import get_app, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+
+
+SIZES = [100, 1_000, 5_000]
+
+
+def traced(func, *args):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    func(*args)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, peak - before
+
+
+def add_loop(frame, widgets):
+    for widget in widgets:
+        frame.add_widget(widget)
+        frame.children
+
+
+def remove_loop(frame, widgets):
+    for widget in widgets:
+        frame.remove_widget(widget)
+        frame.children
+
+
+def read_loop(frame, count):
+    for _ in range(count):
+        for child in frame.children:
+            pass
+
+
+def main():
+    app = get_app()
+    rows = []
+    for flex in ['v', 'grid']:
+        for size in SIZES:
+            frame = TFlexFrame(flex=flex, max_columns=10)
+            widgets = [QLabel(str(i)) for i in range(size)]
+
+            add = traced(add_loop, frame, widgets)
+            read = traced(read_loop, frame, size)
+            remove = traced(remove_loop, frame, widgets[::-2])
+            clear = traced(frame.clear_widgets)
+            app.processEvents()
+
+            rows.append([
+                flex,
+                size,
+                *(f'{peak / 1024:.1f}' for _, peak in [add, read, remove, clear])
+            ])
+    report(
+        'peak traced KiB while adding, reading children, removing and clearing',
+        rows,
+        ['flex', 'widgets', 'add', 'read', 'remove', 'clear']
+    )
+
+
+if __name__ == '__main__':
+    main()
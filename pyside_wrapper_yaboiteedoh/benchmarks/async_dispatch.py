@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+from PySide6.QtCore import QTimer
+
+from .common import report
+from pyside_wrapper_yaboiteedoh.components import TApp, TAction
+
+
+SAMPLES = 500
+IDLE_MS = 2000
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main():
+    app = TApp(deferred=True)
+    dispatch = []
+    resume = []
+    triggered = []
+
+    async def handler():
+        dispatch.append(time.perf_counter() - triggered[-1])
+        start = time.perf_counter()
+        await asyncio.sleep(0)
+        resume.append(time.perf_counter() - start)
+
+    action = TAction('async', func=handler, parent=app.window)
+    idle = []
+
+    def finish():
+        idle.append(time.process_time() - idle.pop())
+        app.app.quit()
+
+    def fire():
+        if len(dispatch) >= SAMPLES:
+            idle.append(time.process_time())
+            QTimer.singleShot(IDLE_MS, finish)
+            return
+        triggered.append(time.perf_counter())
+        action.ping()
+        QTimer.singleShot(2, fire)
+
+    QTimer.singleShot(0, fire)
+    app.exec_async()
+
+    rows = [
+        [name, *(f'{percentile(values, q) * 1e3:.3f}' for q in (0.5, 0.9, 0.99))]
+        for name, values in [
+            ('trigger -> coroutine', dispatch),
+            ('await sleep(0)', resume)
+        ]
+    ]
+    report(
+        f'asyncio callback dispatch over {SAMPLES} triggers (ms)',
+        rows,
+        ['path', 'p50', 'p90', 'p99']
+    )
+    report(
+        f'CPU used while idle under exec_async for {IDLE_MS} ms',
+        [[f'{idle[0] * 1e3:.1f}']],
+        ['cpu ms']
+    )
+
+
+if __name__ == '__main__':
+    main()
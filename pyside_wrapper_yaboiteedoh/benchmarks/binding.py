@@ -0,0 +1,84 @@
+import time
+
+from .common import get_app, report
+from pyside_wrapper_yaboiteedoh.binding import TModel, TField, bind
+from pyside_wrapper_yaboiteedoh.widgets import TLabeledInput
+
+
+TEXT = 'the quick brown fox jumps over the lazy dog'
+KEYSTROKE_MS = 30
+VALIDATION_MS = 2
+POLICIES = [
+    ('immediate', {}),
+    ('debounced', {'delay': 150}),
+    ('throttled', {'delay': 100}),
+    ('commit', {})
+]
+
+
+class Form(TModel):
+    name = TField('')
+
+
+def pump(app, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def type_text(app, policy, kwargs):
+    form = Form()
+    widget = TLabeledInput('Name')
+    binding = bind(widget, form, 'name', policy=policy, **kwargs)
+
+    validations = []
+    arrived = []
+
+    def validate(name, value):
+        start = time.perf_counter()
+        while time.perf_counter() - start < VALIDATION_MS / 1000:
+            pass
+        validations.append(value)
+        if value == TEXT:
+            arrived.append(time.perf_counter())
+    form.changed.connect(validate)
+
+    keystrokes = []
+    for index, char in enumerate(TEXT):
+        last_key = time.perf_counter()
+        widget.input.insert(char)
+        keystrokes.append(time.perf_counter() - last_key)
+        if index < len(TEXT) - 1:
+            pump(app, KEYSTROKE_MS / 1000)
+    if policy == 'commit':
+        widget.input.editingFinished.emit()
+
+    deadline = time.perf_counter() + 1
+    while not arrived and time.perf_counter() < deadline:
+        pump(app, 0.001)
+    binding.unbind()
+    widget.deleteLater()
+
+    return [
+        policy,
+        len(validations),
+        f'{sum(keystrokes) / len(keystrokes) * 1e6:.0f}',
+        f'{max(keystrokes) * 1000:.2f}',
+        f'{(arrived[0] - last_key) * 1000:.1f}' if arrived else 'never'
+    ]
+
+
+def main():
+    app = get_app()
+    rows = [type_text(app, policy, kwargs) for policy, kwargs in POLICIES]
+    report(
+        f'typing {len(TEXT)} characters {KEYSTROKE_MS} ms apart into a bound '
+        f'TLabeledInput with a {VALIDATION_MS} ms validator on the model',
+        rows,
+        ['policy', 'validations', 'mean keystroke us', 'max keystroke ms', 'final value latency ms']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+from PySide6.QtWidgets import QLabel
+
+from .common import get_app, settle, timed, report
+from pyside_wrapper_yaboiteedoh.blueprints import build, compile_spec, patch
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+
+
+SIZES = [10, 50, 100]
+ROWS = 10
+
+
+def spec(sections, title='dashboard'):
+    return {
+        'props': {'scrollbar': 'v'},
+        'children': [
+            {'type': QLabel, 'key': 'title', 'props': {'text': title}},
+            *(
+                {
+                    'key': f'section {s}',
+                    'props': {
+                        'flex': 'grid',
+                        'max_columns': 5,
+                        'label': f'section {s}',
+                        'frame_style': ['box', 'plain', 1, 0]
+                    },
+                    'children': [
+                        {'type': QLabel, 'props': {'text': f'{s}.{r}'}}
+                        for r in range(ROWS)
+                    ]
+                }
+                for s in range(sections)
+            )
+        ]
+    }
+
+
+def imperative(sections, title='dashboard'):
+    root = TFlexFrame(scrollbar='v')
+    root.add_widget(QLabel(title))
+    for s in range(sections):
+        section = root.add_widget(TFlexFrame(
+            flex='grid',
+            max_columns=5,
+            label=f'section {s}',
+            frame_style=['box', 'plain', 1, 0]
+        ))
+        for r in range(ROWS):
+            section.add_widget(QLabel(f'{s}.{r}'))
+    return root
+
+
+def main():
+    app = get_app()
+    rows = []
+    for sections in SIZES:
+        widgets = sections * (ROWS + 1) + 1
+
+        by_hand, root = timed(imperative, sections)
+        root.deleteLater()
+        settle(app)
+
+        compiling, blueprint = timed(compile_spec, spec(sections))
+        building, root = timed(blueprint.build)
+
+        patching, patched = timed(patch, root, spec(sections, 'updated'))
+        assert patched is root
+        root.deleteLater()
+        settle(app)
+
+        rebuilding, root = timed(build, spec(sections, 'rebuilt'))
+        root.deleteLater()
+        settle(app)
+
+        rows.append([
+            widgets,
+            f'{by_hand * 1e3:.2f}',
+            f'{compiling * 1e3:.2f}',
+            f'{building * 1e3:.2f}',
+            f'{rebuilding * 1e3:.2f}',
+            f'{patching * 1e3:.3f}'
+        ])
+    report(
+        'building widget trees by hand vs from a compiled blueprint, and '
+        'patching one label vs rebuilding (ms)',
+        rows,
+        ['widgets', 'by hand', 'compile', 'build', 'rebuild', 'patch']
+    )
+
+
+if __name__ == '__main__':
+    main()
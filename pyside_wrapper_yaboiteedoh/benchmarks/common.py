@@ -0,0 +1,35 @@
+import os
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication
+
+
+def get_app():
+    return QApplication.instance() or QApplication([])
+
+
+def settle(app):
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def report(title, rows, columns):
+    widths = [
+        max(len(str(cell)) for cell in [column, *(row[i] for row in rows)])
+        for i, column in enumerate(columns)
+    ]
+    print(title)
+    for row in [columns, *rows]:
+        print('  '.join(
+            f'{str(cell):>{width}}' for cell, width in zip(row, widths)
+        ))
+    print()
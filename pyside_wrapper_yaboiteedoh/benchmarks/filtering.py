@@ -0,0 +1,102 @@
+from PySide6.QtWidgets import QLabel
+
+from .common import get_app, settle, timed, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+from pyside_wrapper_yaboiteedoh.widgets import TCheckBoxMatrix
+
+
+SIZES = [1_000, 10_000]
+QUERY = 'row 12'
+
+
+def keystrokes():
+    typed = [QUERY[:i] for i in range(1, len(QUERY) + 1)]
+    return typed + typed[-2::-1] + ['']
+
+
+def rows(size):
+    return [{'text': f'Row {i}'} for i in range(size)]
+
+
+def shown(widget):
+    widget.resize(800, 600)
+    widget.show()
+    return widget
+
+
+def filtered(app, size):
+    frame = shown(TFlexFrame(scrollbar='v'))
+    frame.populate(QLabel, rows(size))
+    settle(app)
+
+    touched = 0
+    previous = set(frame.children)
+    elapsed = 0
+    for query in keystrokes():
+        spent, matches = timed(frame.filter_widgets, query)
+        elapsed += spent
+        matches = set(matches)
+        touched += len(previous ^ matches)
+        previous = matches
+        app.processEvents()
+    frame.deleteLater()
+    settle(app)
+    return elapsed, touched
+
+
+def repopulated(app, size):
+    frame = shown(TFlexFrame(scrollbar='v'))
+    objs = rows(size)
+    frame.populate(QLabel, objs)
+    settle(app)
+
+    elapsed = 0
+    for query in keystrokes():
+        query = query.casefold()
+        subset = [obj for obj in objs if query in obj['text'].casefold()]
+        spent, _ = timed(frame.populate, QLabel, subset)
+        elapsed += spent
+        app.processEvents()
+    frame.deleteLater()
+    settle(app)
+    return elapsed
+
+
+def matrix(app, size):
+    widget = shown(TCheckBoxMatrix(
+        scrollbar='v',
+        options=[f'option {i}' for i in range(size)]
+    ))
+    settle(app)
+    elapsed = 0
+    for query in keystrokes():
+        spent, _ = timed(widget.filter_widgets, query.replace('row', 'option'))
+        elapsed += spent
+        app.processEvents()
+    widget.deleteLater()
+    settle(app)
+    return elapsed
+
+
+def main():
+    app = get_app()
+    table = []
+    strokes = len(keystrokes())
+    for size in SIZES:
+        filter_time, touched = filtered(app, size)
+        table.append([
+            size,
+            f'{filter_time / strokes * 1000:.2f}',
+            f'{repopulated(app, size) / strokes * 1000:.2f}',
+            f'{matrix(app, size) / strokes * 1000:.2f}',
+            touched
+        ])
+    report(
+        f'typing and erasing {QUERY!r} ({strokes} keystrokes) over a shown frame, ms per keystroke',
+        table,
+        ['widgets', 'filter_widgets', 'repopulate', 'matrix filter', 'visibility changes']
+    )
+
+
+if __name__ == '__main__':
+    main()
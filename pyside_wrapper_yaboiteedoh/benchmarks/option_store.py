@@ -0,0 +1,113 @@
+import time
+import tracemalloc
+
+from .common import get_app, report
+from pyside_wrapper_yaboiteedoh.widgets import TOptionStore, TCheckBoxList
+
+
+SIZES = [1_000, 100_000]
+READS = 20
+
+
+class DictSetOptions:
+    def __init__(self, labels):
+        self.index = {label: object() for label in labels}
+        self.selected = set()
+
+
+    def __contains__(self, label):
+        return label in self.index
+
+
+    def assign(self, labels):
+        self.selected = {label for label in labels if label in self.index}
+
+
+    def selected_list(self):
+        return [label for label in self.index if label in self.selected]
+
+
+def traced(build):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before
+
+
+def build_store(labels):
+    store = TOptionStore()
+    for label in labels:
+        store.add(label, object())
+    return store
+
+
+def measure(name, size, build, assign, read, lookup):
+    labels = [f'option {i}' for i in range(size)]
+    half = labels[::2]
+    options, memory = traced(lambda: build(labels))
+    _, index = traced(lambda: lookup(options, labels[-1]))
+    start = time.perf_counter()
+    lookup(options, labels[-1])
+    found = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assign(options, half)
+    bulk = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(READS):
+        read(options)
+    reads = (time.perf_counter() - start) / READS
+
+    return [
+        name,
+        size,
+        f'{memory / 1024:.1f}',
+        f'{index / 1024:.1f}',
+        f'{found * 1000:.3f}',
+        f'{bulk * 1000:.2f}',
+        f'{reads * 1000:.2f}'
+    ]
+
+
+def main():
+    get_app()
+    rows = []
+    for size in SIZES:
+        rows.append(measure(
+            'dict + set',
+            size,
+            DictSetOptions,
+            DictSetOptions.assign,
+            DictSetOptions.selected_list,
+            DictSetOptions.__contains__
+        ))
+        rows.append(measure(
+            'TOptionStore',
+            size,
+            build_store,
+            TOptionStore.assign,
+            TOptionStore.selected,
+            TOptionStore.__contains__
+        ))
+        rows.append(measure(
+            'TCheckBoxList',
+            size,
+            lambda labels: TCheckBoxList(options=labels),
+            TCheckBoxList.set_values,
+            lambda view: view.value,
+            lambda view, label: label in view.option_model
+        ))
+    report(
+        'option data with half of the options checked '
+        '(KiB retained, KiB added by a lookup of the last label, '
+        'ms per lookup, bulk set and value read)',
+        rows,
+        ['backend', 'options', 'KiB', '+lookup KiB', 'lookup', 'bulk set', 'read']
+    )
+
+
+if __name__ == '__main__':
+    main()
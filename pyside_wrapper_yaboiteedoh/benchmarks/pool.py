@@ -0,0 +1,45 @@
+from .common import get_app, settle, timed, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+from pyside_wrapper_yaboiteedoh.widgets import TLabeledInput
+
+
+SIZES = [100, 1_000, 2_000]
+CYCLES = 10
+
+
+def repopulate(app, frame, size):
+    for cycle in range(CYCLES):
+        frame.populate(
+            TLabeledInput,
+            ({'text': f'{cycle}:{i}'} for i in range(size))
+        )
+        app.processEvents()
+
+
+def main():
+    app = get_app()
+    rows = []
+    for size in SIZES:
+        for pool_size in [None, size]:
+            frame = TFlexFrame(pool_size=pool_size)
+            frame.show()
+            elapsed, _ = timed(repopulate, app, frame, size)
+            stats = frame.pool.stats if frame.pool is not None else {}
+            rows.append([
+                size,
+                pool_size or '-',
+                f'{elapsed / CYCLES * 1e3:.1f}',
+                stats.get('hits', '-'),
+                stats.get('misses', '-')
+            ])
+            frame.deleteLater()
+            settle(app)
+    report(
+        f'{CYCLES} clear/populate cycles of TLabeledInput rows',
+        rows,
+        ['widgets', 'pool size', 'ms/cycle', 'hits', 'misses']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import time
+
+from PySide6.QtWidgets import QLabel
+
+from .common import get_app, settle, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+from pyside_wrapper_yaboiteedoh.profiling import TProfiler, profiled
+
+
+SIZE = 5_000
+CALLS = 1_000_000
+REPEAT = 5
+
+
+def noop():
+    pass
+
+
+def wrapped_noop():
+    return noop()
+
+
+def per_call(func):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        func()
+    return (time.perf_counter() - start) / CALLS * 1e9
+
+
+def add_loop(app, add):
+    frame = TFlexFrame()
+    widgets = [QLabel(str(i)) for i in range(SIZE)]
+    start = time.perf_counter()
+    for widget in widgets:
+        add(frame, widget)
+    elapsed = time.perf_counter() - start
+    frame.deleteLater()
+    settle(app)
+    return elapsed * 1000
+
+
+def main():
+    app = get_app()
+    profiler = TProfiler()
+    profiled_noop = profiled('noop')(noop)
+
+    rows = [
+        ['plain call', f'{per_call(noop):.0f}'],
+        ['plain wrapper', f'{per_call(wrapped_noop):.0f}'],
+        ['@profiled, disabled', f'{per_call(profiled_noop):.0f}']
+    ]
+    with profiler.recording():
+        rows.append(['@profiled, enabled', f'{per_call(profiled_noop):.0f}'])
+    report(
+        'cost of calling an empty function (ns per call)',
+        rows,
+        ['call', 'ns']
+    )
+
+    raw = TFlexFrame.add_widget.__wrapped__
+    best = {'undecorated': [], 'disabled': [], 'enabled': []}
+    for _ in range(REPEAT):
+        best['undecorated'].append(add_loop(app, raw))
+        best['disabled'].append(add_loop(app, TFlexFrame.add_widget))
+        with profiler.recording():
+            best['enabled'].append(add_loop(app, TFlexFrame.add_widget))
+    rows = [[name, f'{min(times):.1f}'] for name, times in best.items()]
+    report(
+        f'adding {SIZE} labels to a hidden TFlexFrame (best of {REPEAT}, ms)',
+        rows,
+        ['profiler', 'ms']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import time
+
+from PySide6.QtWidgets import QLabel
+
+from .common import get_app, settle, timed, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+
+
+SIZES = [100, 1_000, 5_000]
+WIDTHS = [1200, 1190, 700, 690, 1300, 400] * 5
+
+
+def labels(size):
+    return [{'text': f'cell {i}'} for i in range(size)]
+
+
+def shown_grid(size, **kwargs):
+    frame = TFlexFrame(flex='grid', max_columns=8, **kwargs)
+    frame.populate(QLabel, labels(size))
+    frame.resize(1200, 800)
+    frame.show()
+    return frame
+
+
+def repopulate(frame, columns, size):
+    frame.clear_widgets()
+    frame._max_columns = columns
+    frame.populate(QLabel, labels(size))
+
+
+def resize_storm(app, frame):
+    reflows = 0
+
+    def count():
+        nonlocal reflows
+        reflows += 1
+    frame._reflow_timer.timeout.connect(count)
+
+    for width in WIDTHS:
+        frame.resize(width, 800)
+        app.processEvents()
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        app.processEvents()
+    return reflows
+
+
+def breakpoint_round_trip(app):
+    frame = TFlexFrame(flex='grid', max_columns=2, breakpoints={800: 4, 1200: 6})
+    frame.populate(QLabel, labels(12))
+    frame.show()
+
+    columns = []
+    for width in [1300, 900, 500]:
+        frame.resize(width, 400)
+        frame._apply_breakpoints()
+        columns.append(frame.max_columns)
+    frame.deleteLater()
+    settle(app)
+    return columns
+
+
+def main():
+    app = get_app()
+    columns = breakpoint_round_trip(app)
+    if columns != [6, 4, 2]:
+        raise SystemExit(
+            f'breakpoints did not return to the base column count: {columns}'
+        )
+
+    rows = []
+    for size in SIZES:
+        frame = shown_grid(size)
+        settle(app)
+        reflow, _ = timed(setattr, frame, 'max_columns', 6)
+        settle(app)
+        same, _ = timed(setattr, frame, 'max_columns', 6)
+        rebuild, _ = timed(repopulate, frame, 4, size)
+        frame.deleteLater()
+        settle(app)
+
+        frame = shown_grid(size, breakpoints={0: 2, 600: 4, 1000: 8})
+        settle(app)
+        reflows = resize_storm(app, frame)
+        frame.deleteLater()
+        settle(app)
+
+        rows.append([
+            size,
+            f'{reflow * 1000:.2f}',
+            f'{same * 1000:.3f}',
+            f'{rebuild * 1000:.2f}',
+            f'{len(WIDTHS)} -> {reflows}'
+        ])
+    report(
+        'changing max_columns 8 -> 6 on a shown grid vs clearing and repopulating (ms)',
+        rows,
+        ['widgets', 'reflow', 'unchanged', 'repopulate', 'resizes -> reflows']
+    )
+
+
+if __name__ == '__main__':
+    main()
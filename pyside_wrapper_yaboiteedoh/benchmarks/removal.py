@@ -0,0 +1,56 @@
+from PySide6.QtWidgets import QLabel
+
+from .common import get_app, timed, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+
+
+SIZES = [1_000, 5_000, 20_000]
+REMOVALS = 100
+
+
+def build(size, flex):
+    frame = TFlexFrame(flex=flex, max_columns=10)
+    with frame.batch():
+        for i in range(size):
+            frame.add_widget(QLabel(str(i)))
+    return frame
+
+
+def remove_one_by_one(frame, widgets):
+    for widget in widgets:
+        frame.remove_widget(widget)
+
+
+def remove_bulk(frame, widgets):
+    frame.remove_widgets(widgets)
+
+
+def near_tail(frame):
+    return frame.children[-2 * REMOVALS:-REMOVALS]
+
+
+def main():
+    app = get_app()
+    rows = []
+    for flex in ['v', 'grid']:
+        for size in SIZES:
+            frame = build(size, flex)
+            single, _ = timed(remove_one_by_one, frame, near_tail(frame))
+            frame = build(size, flex)
+            bulk, _ = timed(remove_bulk, frame, near_tail(frame))
+            app.processEvents()
+            rows.append([
+                flex,
+                size,
+                f'{single / REMOVALS * 1e6:.1f}',
+                f'{bulk * 1e3:.2f}'
+            ])
+    report(
+        f'removing {REMOVALS} widgets {REMOVALS} slots from the end of a frame',
+        rows,
+        ['flex', 'size', 'us/remove', 'bulk ms']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+
+from PySide6.QtWidgets import QApplication, QLabel
+
+from .common import get_app, settle, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+from pyside_wrapper_yaboiteedoh.profiling import TLifetimeTracker
+from pyside_wrapper_yaboiteedoh.widgets import TRadioMenu, TCheckBoxMatrix
+
+
+ROWS = 20
+WARMUP = 0.1
+MAX_GROWTH_KIB = 256
+
+
+def rss_kib():
+    try:
+        with open('/proc/self/statm') as file:
+            pages = int(file.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def populate_frame():
+    frame = TFlexFrame(flex='grid', max_columns=5)
+    objs = [[{'text': f'{turn} {i}'} for i in range(ROWS)] for turn in 'ab']
+    return frame, lambda i: frame.populate(QLabel, objs[i % 2])
+
+
+def radio_options():
+    menu = TRadioMenu(flex='grid', max_columns=5)
+    options = [[f'{turn} {i}' for i in range(ROWS)] for turn in 'ab']
+
+    def run(i):
+        menu.options = options[i % 2]
+        menu.value = options[i % 2][i % ROWS]
+    return menu, run
+
+
+def matrix_options():
+    matrix = TCheckBoxMatrix(flex='grid', max_columns=5)
+    options = [[f'{turn} {i}' for i in range(ROWS)] for turn in 'ab']
+
+    def run(i):
+        matrix.options = options[i % 2]
+        matrix.value = options[i % 2][::2]
+    return matrix, run
+
+
+CASES = {
+    'TFlexFrame.populate': populate_frame,
+    'TRadioMenu.options': radio_options,
+    'TCheckBoxMatrix.options': matrix_options
+}
+
+
+def soak(app, build, iterations):
+    tracker = TLifetimeTracker()
+    root, run = build()
+    warmup = max(int(iterations * WARMUP), 1)
+
+    start = time.perf_counter()
+    with tracker.tracking():
+        for i in range(iterations):
+            run(i)
+            settle(app)
+            if i + 1 == warmup:
+                gc.collect()
+                tracemalloc.start()
+                widgets = len(QApplication.allWidgets())
+                rss = rss_kib()
+        elapsed = time.perf_counter() - start
+
+        gc.collect()
+        settle(app)
+        growth, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    end_rss = rss_kib()
+    return {
+        'seconds': elapsed,
+        'traced_kib': growth / 1024,
+        'widgets': len(QApplication.allWidgets()) - widgets,
+        'rss_kib': None if rss is None else end_rss - rss,
+        'leaks': tracker.leaks()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.soak',
+        description='repopulate frames and option widgets and check memory stays flat'
+    )
+    parser.add_argument('--iterations', type=int, default=10_000)
+    parser.add_argument('--case', action='append', choices=list(CASES))
+    args = parser.parse_args()
+
+    app = get_app()
+    rows = []
+    failures = []
+    for name in args.case or CASES:
+        result = soak(app, CASES[name], args.iterations)
+        rows.append([
+            name,
+            f'{result["seconds"]:.1f}',
+            f'{result["traced_kib"]:.1f}',
+            result['widgets'],
+            result['rss_kib'],
+            sum(result['leaks'].values())
+        ])
+        if (
+            result['traced_kib'] > MAX_GROWTH_KIB
+            or result['widgets']
+            or result['leaks']
+        ):
+            failures.append((name, result))
+
+    report(
+        f'{args.iterations} repopulates of {ROWS} rows after {WARMUP:.0%} warmup',
+        rows,
+        ['case', 's', 'traced KiB', 'widgets +/-', 'rss KiB', 'leaked']
+    )
+    for name, result in failures:
+        print(f'{name}: memory did not stay flat: {result}')
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from .common import report
+
+
+RUNS = 5
+
+SNIPPET = '''
+import json
+import time
+
+started = time.perf_counter()
+import pyside_wrapper_yaboiteedoh
+package = time.perf_counter() - started
+
+from pyside_wrapper_yaboiteedoh import TApp, TFlexFrame
+from PySide6.QtWidgets import QLabel
+
+app = TApp(deferred={deferred})
+frame = TFlexFrame()
+frame.populate(QLabel, ({{'text': str(i)}} for i in range(50)))
+frame.greedy.connect(app.surrender)
+frame.greedy.emit()
+app.show()
+
+while app.startup['first_paint'] is None:
+    app.app.processEvents()
+
+print(json.dumps({{
+    'package': round(package * 1e3, 3),
+    **app.startup_report(),
+    'total': round((time.perf_counter() - started) * 1e3, 3)
+}}))
+'''
+
+
+def measure(deferred):
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    output = subprocess.run(
+        [sys.executable, '-c', SNIPPET.format(deferred=deferred)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup')
+    parser.add_argument('--runs', type=int, default=RUNS)
+    parser.add_argument('--json')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for mode, deferred in [('eager', False), ('deferred', True)]:
+        runs = [measure(deferred) for _ in range(args.runs)]
+        results[mode] = {
+            stage: median(run[stage] for run in runs)
+            for stage in runs[0]
+        }
+
+    stages = list(results['eager'])
+    report(
+        f'startup, median of {args.runs} cold runs (ms)',
+        [[mode, *(timings[stage] for stage in stages)]
+         for mode, timings in results.items()],
+        ['mode', *stages]
+    )
+
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+from .common import get_app, settle, timed, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame, TTheme
+
+
+SIZES = [100, 1_000, 5_000]
+RULES = {
+    'background-color': '#202020',
+    'border': '1px solid #404040',
+    'border-radius': '4px',
+    'color': '#e0e0e0'
+}
+STYLESHEET = ' '.join(f'{key}: {value};' for key, value in RULES.items())
+
+
+class StyledRow(TFlexFrame):
+    def __init__(self, **kwargs):
+        super().__init__(size_policy='x', **kwargs)
+        self.setStyleSheet(f'TFlexFrame {{ {STYLESHEET} }}')
+
+
+class ClassedRow(TFlexFrame):
+    def __init__(self, **kwargs):
+        super().__init__(size_policy='x', style_class='row', **kwargs)
+
+
+def populate(app, blueprint_class, size):
+    frame = TFlexFrame(scrollbar='v')
+    frame.resize(800, 600)
+    frame.show()
+    frame.populate(blueprint_class, ({} for _ in range(size)))
+    app.processEvents()
+    return frame
+
+
+def main():
+    app = get_app()
+    theme = TTheme(app)
+
+    rows = []
+    for size in SIZES:
+        theme.unregister('row')
+        per_widget, frame = timed(populate, app, StyledRow, size)
+        frame.deleteLater()
+        settle(app)
+
+        theme.register('row', RULES)
+        classed, frame = timed(populate, app, ClassedRow, size)
+        frame.deleteLater()
+        settle(app)
+
+        rows.append([
+            size,
+            f'{per_widget * 1e3:.1f}',
+            f'{classed * 1e3:.1f}',
+            f'{per_widget / classed:.2f}x'
+        ])
+    report(
+        'populating styled frames: per-widget setStyleSheet vs theme style_class',
+        rows,
+        ['frames', 'per-widget ms', 'style_class ms', 'speedup']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import PySide6
+from PySide6.QtWidgets import QApplication, QLabel
+
+from .common import get_app, settle, report
+from pyside_wrapper_yaboiteedoh.components import TFlexFrame
+from pyside_wrapper_yaboiteedoh.widgets import TRadioMenu, TCheckBoxMatrix
+
+
+SIZES = [10, 100, 1_000, 10_000]
+FULL_SIZES = [*SIZES, 100_000]
+FLEXES = ['v', 'h', 'grid']
+EDITS = 100
+
+CASES = {}
+
+
+def case(name, flexes=FLEXES):
+    def register(func):
+        CASES[name] = (func, flexes)
+        return func
+    return register
+
+
+def qt_widgets():
+    return len(QApplication.allWidgets())
+
+
+def shown(widget):
+    widget.resize(800, 600)
+    widget.show()
+    return widget
+
+
+def labels(size):
+    return [{'text': f'row {i}'} for i in range(size)]
+
+
+def middle(frame, count):
+    start = max(len(frame.children) - count, 0) // 2
+    return frame.children[start:start + count]
+
+
+@case('add_widget')
+def add_widget(size, flex):
+    frame = shown(TFlexFrame(flex=flex, max_columns=10))
+    widgets = [QLabel(obj['text']) for obj in labels(size)]
+
+    def run():
+        for widget in widgets:
+            frame.add_widget(widget)
+    return frame, run
+
+
+@case('populate')
+def populate(size, flex):
+    frame = shown(TFlexFrame(flex=flex, max_columns=10))
+    return frame, lambda: frame.populate(QLabel, labels(size))
+
+
+@case('remove_widget')
+def remove_widget(size, flex):
+    frame = shown(TFlexFrame(flex=flex, max_columns=10))
+    frame.populate(QLabel, labels(size))
+    doomed = middle(frame, EDITS)
+
+    def run():
+        for widget in doomed:
+            frame.remove_widget(widget)
+    return frame, run
+
+
+@case('remove_widgets')
+def remove_widgets(size, flex):
+    frame = shown(TFlexFrame(flex=flex, max_columns=10))
+    frame.populate(QLabel, labels(size))
+    doomed = middle(frame, EDITS)
+    return frame, lambda: frame.remove_widgets(doomed)
+
+
+@case('clear_widgets')
+def clear_widgets(size, flex):
+    frame = shown(TFlexFrame(flex=flex, max_columns=10))
+    frame.populate(QLabel, labels(size))
+    return frame, frame.clear_widgets
+
+
+@case('max_columns', flexes=['grid'])
+def max_columns(size, flex):
+    frame = shown(TFlexFrame(flex=flex, max_columns=10))
+    frame.populate(QLabel, labels(size))
+
+    def run():
+        frame.max_columns = 8
+    return frame, run
+
+
+def options(size):
+    return [f'option {i}' for i in range(size)]
+
+
+@case('radio.options', flexes=['v', 'grid'])
+def radio_options(size, flex):
+    menu = shown(TRadioMenu(flex=flex, max_columns=10))
+
+    def run():
+        menu.options = options(size)
+    return menu, run
+
+
+@case('radio.value', flexes=['v'])
+def radio_value(size, flex):
+    menu = shown(TRadioMenu(flex=flex, options=options(size)))
+    targets = middle(menu, EDITS)
+    values = [menu.options[menu.children.index(option)] for option in targets]
+
+    def run():
+        for value in values:
+            menu.value = value
+    return menu, run
+
+
+@case('matrix.options', flexes=['v', 'grid'])
+def matrix_options(size, flex):
+    matrix = shown(TCheckBoxMatrix(flex=flex, max_columns=10))
+
+    def run():
+        matrix.options = options(size)
+    return matrix, run
+
+
+@case('matrix.value', flexes=['v'])
+def matrix_value(size, flex):
+    matrix = shown(TCheckBoxMatrix(flex=flex, options=options(size)))
+    values = options(size)[::2]
+    return matrix, lambda: matrix.set_values(values)
+
+
+def measure(app, name, size, flex, traced):
+    func, _ = CASES[name]
+    root, run = func(size, flex)
+    settle(app)
+
+    widgets = qt_widgets()
+    if traced:
+        tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    settle(app)
+    wall = time.perf_counter() - start
+    peak = 0
+    if traced:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    widgets = qt_widgets() - widgets
+
+    root.deleteLater()
+    settle(app)
+    return wall, peak, widgets
+
+
+def run_suite(sizes, names, repeat):
+    app = get_app()
+    results = {}
+    for name in names:
+        _, flexes = CASES[name]
+        for flex in flexes:
+            for size in sizes:
+                wall = min(
+                    measure(app, name, size, flex, False)[0]
+                    for _ in range(repeat)
+                )
+                _, peak, widgets = measure(app, name, size, flex, True)
+                results[f'{name}[{flex}-{size}]'] = {
+                    'case': name,
+                    'flex': flex,
+                    'size': size,
+                    'wall': wall,
+                    'peak': peak,
+                    'widgets': widgets
+                }
+    return results
+
+
+def metadata():
+    return {
+        'python': platform.python_version(),
+        'pyside': PySide6.__version__,
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    rows = []
+    for key, result in results.items():
+        previous = baseline['results'].get(key)
+        if previous is None or not previous['wall']:
+            continue
+        ratio = result['wall'] / previous['wall']
+        flag = ''
+        if ratio > threshold:
+            flag = 'REGRESSION'
+            regressions.append(key)
+        rows.append([
+            key,
+            f'{previous["wall"] * 1e3:.2f}',
+            f'{result["wall"] * 1e3:.2f}',
+            f'{ratio:.2f}',
+            flag
+        ])
+    report(
+        f'against baseline from {baseline["meta"]["time"]}',
+        rows,
+        ['case', 'baseline ms', 'current ms', 'ratio', '']
+    )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('--sizes', type=lambda value: [
+        int(size) for size in value.split(',')
+    ])
+    parser.add_argument('--full', action='store_true')
+    parser.add_argument('--case', action='append', choices=list(CASES))
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--save')
+    parser.add_argument('--compare')
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (FULL_SIZES if args.full else SIZES)
+    results = run_suite(sizes, args.case or list(CASES), args.repeat)
+
+    report(
+        'headless widget operation benchmarks',
+        [
+            [
+                key,
+                f'{result["wall"] * 1e3:.2f}',
+                f'{result["peak"] / 1024:.1f}',
+                result['widgets']
+            ]
+            for key, result in results.items()
+        ],
+        ['case', 'wall ms', 'peak KiB', 'widgets +/-']
+    )
+
+    if args.save:
+        with open(args.save, 'w') as baseline:
+            json.dump({'meta': metadata(), 'results': results}, baseline, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(results, json.load(baseline), args.threshold)
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,108 @@
+import time
+import tracemalloc
+from collections.abc import Sequence
+
+from PySide6.QtWidgets import QLabel, QWidget
+
+from .common import get_app, settle, report
+from pyside_wrapper_yaboiteedoh.components import TVirtualFlexFrame
+
+
+SIZES = [1_000, 100_000, 1_000_000]
+STEPS = 200
+
+
+class Rows(Sequence):
+    def __init__(self, size):
+        self.size = size
+
+
+    def __len__(self):
+        return self.size
+
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return {'text': f'row {index}'}
+
+
+def scroll(app, frame):
+    bar = frame.verticalScrollBar()
+    stride = max(bar.maximum() // STEPS, bar.singleStep())
+    frame_times = []
+    for step in range(STEPS):
+        start = time.perf_counter()
+        bar.setValue(step * stride)
+        app.processEvents()
+        frame_times.append(time.perf_counter() - start)
+    return frame_times
+
+
+def shrink(app, flex):
+    frame = TVirtualFlexFrame(flex=flex, max_columns=4)
+    frame.resize(200, 200)
+    frame.show()
+    frame.populate(QLabel, Rows(100))
+    app.processEvents()
+    frame.populate(QLabel, Rows(2))
+    app.processEvents()
+
+    shown = sorted(
+        widget.text()
+        for widget in frame.viewport().findChildren(QLabel)
+        if widget.isVisible()
+    )
+    frame.deleteLater()
+    settle(app)
+    return shown
+
+
+def main():
+    app = get_app()
+    for flex in ['v', 'grid']:
+        shown = shrink(app, flex)
+        if shown != ['row 0', 'row 1']:
+            raise SystemExit(
+                f'{flex}: stale rows after repopulating with 2 rows: {shown}'
+            )
+
+    rows = []
+    for flex in ['v', 'grid']:
+        for size in SIZES:
+            frame = TVirtualFlexFrame(flex=flex, max_columns=4)
+            frame.resize(400, 600)
+            frame.show()
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            frame.populate(QLabel, Rows(size))
+            app.processEvents()
+            populate = time.perf_counter() - start
+
+            frame_times = sorted(scroll(app, frame))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            widgets = len(frame.viewport().findChildren(QWidget))
+            rows.append([
+                flex,
+                size,
+                widgets,
+                f'{populate * 1e3:.2f}',
+                f'{frame_times[len(frame_times) // 2] * 1e3:.3f}',
+                f'{frame_times[-1] * 1e3:.3f}',
+                f'{peak / 1024:.0f}'
+            ])
+            frame.deleteLater()
+            settle(app)
+    report(
+        f'virtualized frame, {STEPS} scroll steps across the whole dataset',
+        rows,
+        ['flex', 'rows', 'widgets', 'populate ms', 'p50 frame ms',
+         'max frame ms', 'peak KiB']
+    )
+
+
+if __name__ == '__main__':
+    main()
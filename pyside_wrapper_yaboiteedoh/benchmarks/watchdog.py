@@ -0,0 +1,69 @@
+import time
+
+from PySide6.QtCore import QTimer
+
+from .common import get_app, report
+from pyside_wrapper_yaboiteedoh.components import TWatchdog
+
+
+RUN_MS = 2_000
+STALLS_MS = [150, 300, 600]
+
+
+def blocking_handler(duration):
+    time.sleep(duration / 1000)
+
+
+def run(app, watchdog=None):
+    for index, duration in enumerate(STALLS_MS):
+        QTimer.singleShot(
+            (index + 1) * RUN_MS // (len(STALLS_MS) + 1),
+            lambda duration=duration: blocking_handler(duration)
+        )
+    QTimer.singleShot(RUN_MS, app.quit)
+
+    if watchdog is not None:
+        watchdog.start()
+    start = time.process_time()
+    app.exec()
+    cpu = time.process_time() - start
+    if watchdog is not None:
+        watchdog.stop()
+    return cpu * 1000
+
+
+def main():
+    app = get_app()
+    bare = run(app)
+    watchdog = TWatchdog(threshold=100)
+    watched = run(app, watchdog)
+    result = watchdog.report()
+
+    report(
+        f'{RUN_MS} ms event loop run with blocking handlers of {STALLS_MS} ms',
+        [
+            ['cpu ms without watchdog', f'{bare:.1f}'],
+            ['cpu ms with watchdog', f'{watched:.1f}'],
+            ['heartbeats', result['frames']],
+            ['p50 frame ms', f'{result["p50_ms"]:.2f}'],
+            ['p99 frame ms', f'{result["p99_ms"]:.2f}'],
+            ['max frame ms', f'{result["max_ms"]:.2f}']
+        ],
+        ['metric', 'value']
+    )
+    report(
+        'stalls over 100 ms',
+        [
+            [
+                f'{stall["duration_ms"]:.1f}',
+                len(stall['samples']),
+                stall['samples'][0][-1] if stall['samples'] else ''
+            ]
+            for stall in result['stalls']
+        ],
+        ['ms', 'samples', 'sampled frame']
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import importlib
+
+
+_EXPORTS = {
+    'TAction': 'components',
+    'TActionRegistry': 'components',
+    'TCoalescedSignal': 'components',
+    'TWatchdog': 'components',
+    'TTheme': 'components',
+    'TApp': 'components',
+    'TWidgetPool': 'components',
+    'TLazyWidget': 'components',
+    'TFlexFrame': 'components',
+    'TVirtualFlexFrame': 'components',
+    'TSearchIndex': 'components',
+    'TCheckBox': 'components',
+    'rebind_widget': 'components',
+    'async_slot': 'components',
+    'set_style_class': 'components',
+    'TProfiler': 'profiling',
+    'profiled': 'profiling',
+    'TLifetimeTracker': 'profiling',
+    'TLabeledInput': 'widgets',
+    'TOptionStore': 'widgets',
+    'TOptionFrame': 'widgets',
+    'TRadioMenu': 'widgets',
+    'TCheckBoxMatrix': 'widgets',
+    'TOptionModel': 'widgets',
+    'TOptionView': 'widgets',
+    'TRadioList': 'widgets',
+    'TCheckBoxList': 'widgets',
+    'TBlueprint': 'blueprints',
+    'compile_spec': 'blueprints',
+    'build': 'blueprints',
+    'patch': 'blueprints',
+    'TField': 'binding',
+    'TModel': 'binding',
+    'TBinding': 'binding',
+    'bind': 'binding',
+    'TAsyncioBridge': 'asyncio_bridge'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_EXPORTS])
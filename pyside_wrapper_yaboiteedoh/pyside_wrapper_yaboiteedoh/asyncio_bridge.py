@@ -0,0 +1,164 @@
+import asyncio
+import heapq
+import math
+import selectors
+
+from PySide6.QtCore import Qt, QObject, QTimer, QSocketNotifier
+
+
+SOCKET_EVENTS = {
+    selectors.EVENT_READ: QSocketNotifier.Type.Read,
+    selectors.EVENT_WRITE: QSocketNotifier.Type.Write
+}
+
+
+class _QtSelector(selectors.DefaultSelector):
+    def __init__(self, wake):
+        super().__init__()
+        self._wake = wake
+        self._notifiers = {}
+
+
+    def register(self, fileobj, events, data=None):
+        key = super().register(fileobj, events, data)
+        self._watch(key.fd, events)
+        return key
+
+
+    def unregister(self, fileobj):
+        key = super().unregister(fileobj)
+        self._watch(key.fd, 0)
+        return key
+
+
+    def modify(self, fileobj, events, data=None):
+        key = super().modify(fileobj, events, data)
+        self._watch(key.fd, events)
+        return key
+
+
+    def close(self):
+        for fd in list(self._notifiers):
+            self._watch(fd, 0)
+        super().close()
+
+
+    def _watch(self, fd, events):
+        notifiers = self._notifiers.setdefault(fd, {})
+        for event, kind in SOCKET_EVENTS.items():
+            if events & event:
+                if event not in notifiers:
+                    notifier = notifiers[event] = QSocketNotifier(fd, kind)
+                    notifier.activated.connect(self._wake)
+            elif event in notifiers:
+                notifiers.pop(event).setEnabled(False)
+
+        if not notifiers:
+            del self._notifiers[fd]
+
+
+class _QtEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self, bridge):
+        self._qt_bridge = bridge
+        super().__init__(_QtSelector(bridge._wake))
+
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self._qt_bridge._wake()
+        return handle
+
+
+    def call_at(self, when, callback, *args, context=None):
+        handle = super().call_at(when, callback, *args, context=context)
+        self._qt_bridge._schedule(handle)
+        return handle
+
+
+class TAsyncioBridge(QObject):
+    current = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._deadlines = []
+
+        self._soon = QTimer(self)
+        self._soon.setSingleShot(True)
+        self._soon.setInterval(0)
+        self._soon.timeout.connect(self._tick)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+        self.loop = _QtEventLoop(self)
+        asyncio.set_event_loop(self.loop)
+
+        TAsyncioBridge.current = self
+
+
+    def schedule(self, coro):
+        return self.loop.create_task(coro)
+
+
+    def close(self):
+        if not self.loop.is_closed():
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True)
+                )
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+        self._soon.stop()
+        self._timer.stop()
+        self._deadlines = []
+        if TAsyncioBridge.current is self:
+            TAsyncioBridge.current = None
+
+
+    def _wake(self, *args):
+        if not self._soon.isActive():
+            self._soon.start()
+
+
+    def _schedule(self, handle):
+        if handle.when() <= self.loop.time():
+            self._wake()
+            return
+
+        heapq.heappush(self._deadlines, handle)
+        if self._deadlines[0] is handle:
+            self._arm()
+
+
+    def _arm(self):
+        deadlines = self._deadlines
+        while deadlines and deadlines[0].cancelled():
+            heapq.heappop(deadlines)
+
+        if not deadlines:
+            self._timer.stop()
+            return
+        delay = math.ceil((deadlines[0].when() - self.loop.time()) * 1000)
+        self._timer.start(max(delay, 0))
+
+
+    def _tick(self):
+        if self.loop.is_running() or self.loop.is_closed():
+            return
+
+        started = self.loop.time()
+        self.loop.call_soon(self.loop.stop)
+        self._soon.stop()
+        self.loop.run_forever()
+
+        deadlines = self._deadlines
+        while deadlines and deadlines[0].when() <= started:
+            heapq.heappop(deadlines)
+        self._arm()
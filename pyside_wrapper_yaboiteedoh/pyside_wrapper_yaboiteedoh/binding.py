@@ -0,0 +1,196 @@
+import functools
+import time
+from operator import attrgetter
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from .components import TCheckBox
+from .widgets import TLabeledInput, TOptionFrame, TOptionView
+
+
+POLICIES = {'immediate', 'commit', 'debounced', 'throttled'}
+
+WIDGET_BINDINGS = {
+    TLabeledInput: ('value', 'input.textChanged', 'input.editingFinished'),
+    TCheckBox: ('checked', 'toggled', 'toggled'),
+    TOptionFrame: ('value', 'selectionChanged', 'selectionChanged'),
+    TOptionView: ('value', 'selectionChanged', 'selectionChanged')
+}
+
+
+class TField:
+    def __init__(self, default=None):
+        self.default = default
+
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+
+    def __get__(self, model, owner=None):
+        if model is None:
+            return self
+        return model._values.get(self.name, self.default)
+
+
+    def __set__(self, model, value):
+        model.set(self.name, value)
+
+
+class TModel(QObject):
+    changed = Signal(str, object)
+    committed = Signal(dict)
+
+    def __init__(self, parent=None, **values):
+        super().__init__(parent)
+
+        self._values = {}
+        self.dirty = set()
+
+        fields = self.fields()
+        for name, value in values.items():
+            if name not in fields:
+                raise AttributeError(f'{type(self).__name__} has no field {name!r}')
+            self._values[name] = value
+
+
+    @classmethod
+    def fields(cls):
+        return _fields(cls)
+
+
+    def set(self, name, value):
+        if getattr(self, name) == value:
+            return False
+
+        self._values[name] = value
+        self.dirty.add(name)
+        self.changed.emit(name, value)
+        return True
+
+
+    def update(self, **values):
+        return [name for name, value in values.items() if self.set(name, value)]
+
+
+    def commit(self):
+        if not self.dirty:
+            return {}
+
+        changes = {name: getattr(self, name) for name in sorted(self.dirty)}
+        self.dirty = set()
+        self.committed.emit(changes)
+        return changes
+
+
+    def snapshot(self):
+        return {name: getattr(self, name) for name in self.fields()}
+
+
+class TBinding(QObject):
+    def __init__(
+        self,
+        widget,
+        model,
+        field,
+        policy='debounced',
+        delay=150,
+        prop=None,
+        parent=None
+    ):
+        super().__init__(parent or widget)
+
+        if policy not in POLICIES:
+            raise ValueError(f'policy must be one of {sorted(POLICIES)}')
+        default_prop, live, commit = _widget_spec(widget)
+
+        self.widget = widget
+        self.model = model
+        self.field = field
+        self.policy = policy
+        self.delay = delay
+        self.prop = prop or default_prop
+        self.pushes = 0
+
+        self._updating = False
+        self._last_push = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+        self._signal = attrgetter(commit if policy == 'commit' else live)(widget)
+        self._signal.connect(self._widget_changed)
+        self.model.changed.connect(self._model_changed)
+        self._model_changed(field, getattr(model, field))
+
+
+    @property
+    def pending(self):
+        return self._timer.isActive()
+
+
+    def flush(self):
+        self._timer.stop()
+        self._last_push = time.perf_counter()
+        if self.model.set(self.field, getattr(self.widget, self.prop)):
+            self.pushes += 1
+
+
+    def unbind(self):
+        self._timer.stop()
+        self._signal.disconnect(self._widget_changed)
+        self.model.changed.disconnect(self._model_changed)
+
+
+    def _widget_changed(self, *args):
+        if self._updating:
+            return
+
+        match self.policy:
+            case 'immediate' | 'commit':
+                self.flush()
+            case 'debounced':
+                self._timer.start(self.delay)
+            case 'throttled':
+                if self._last_push is None:
+                    self.flush()
+                    return
+                waited = (time.perf_counter() - self._last_push) * 1000
+                if waited >= self.delay:
+                    self.flush()
+                elif not self._timer.isActive():
+                    self._timer.start(int(self.delay - waited))
+
+
+    def _model_changed(self, name, value):
+        if name != self.field or getattr(self.widget, self.prop) == value:
+            return
+
+        self._updating = True
+        try:
+            setattr(self.widget, self.prop, value)
+        finally:
+            self._updating = False
+
+
+def bind(widget, model, field, **kwargs):
+    return TBinding(widget, model, field, **kwargs)
+
+
+@functools.cache
+def _fields(cls):
+    return tuple(dict.fromkeys(
+        name
+        for klass in reversed(cls.__mro__)
+        for name, value in vars(klass).items()
+        if isinstance(value, TField)
+    ))
+
+
+def _widget_spec(widget):
+    for cls in type(widget).__mro__:
+        spec = WIDGET_BINDINGS.get(cls)
+        if spec is not None:
+            return spec
+    raise TypeError(f'{type(widget).__name__} has no binding spec')
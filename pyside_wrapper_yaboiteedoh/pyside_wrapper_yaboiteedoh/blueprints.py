@@ -0,0 +1,234 @@
+from PySide6.QtWidgets import QWidget
+
+from .components import (
+    FRAME_SHAPES,
+    SHADOW_STYLES,
+    SIZE_POLICIES,
+    SCROLLBAR_POLICIES,
+    TFlexFrame,
+    rebind_widget
+)
+
+
+SPEC_KEYS = {'type', 'key', 'props', 'children', 'stretch'}
+
+FLEXES = {'v', 'h', 'grid'}
+
+FRAME_CONSTRUCTOR_PROPS = {
+    'flex',
+    'scrollbar',
+    'size_policy',
+    'label',
+    'accept_drops',
+    'frame_style',
+    'pool_size',
+    'breakpoints',
+    'reflow_delay'
+}
+
+CACHE_SIZE = 1024
+
+_compiled = {}
+
+
+class TBlueprint:
+    def __init__(
+        self,
+        widget_class,
+        key=None,
+        props={},
+        children=(),
+        stretch=0
+    ):
+        self.widget_class = widget_class
+        self.key = key
+        self.props = props
+        self.children = children
+        self.stretch = stretch
+
+        self.fixed_props = {}
+        if issubclass(widget_class, TFlexFrame):
+            self.fixed_props = {
+                prop: value for prop, value in props.items()
+                if prop in FRAME_CONSTRUCTOR_PROPS
+            }
+
+
+    def build(self):
+        widget = self.widget_class(**self.props)
+        widget.blueprint = self
+
+        for child in self.children:
+            widget.add_widget(child.build(), stretch=child.stretch)
+        return widget
+
+
+    def patch(self, widget):
+        old = getattr(widget, 'blueprint', None)
+        if old is self:
+            return widget
+        if not self._compatible(old):
+            return self.build()
+
+        changed = {
+            prop: value for prop, value in self.props.items()
+            if prop not in old.props or old.props[prop] != value
+        }
+        if changed:
+            rebind_widget(widget, changed)
+
+        if self.children or old.children:
+            self._patch_children(widget, old)
+
+        widget.blueprint = self
+        return widget
+
+
+    def _compatible(self, old):
+        return (
+            old is not None
+            and old.widget_class is self.widget_class
+            and old.fixed_props == self.fixed_props
+            and old.props.keys() <= self.props.keys()
+        )
+
+
+    def _patch_children(self, widget, old):
+        current = {
+            child.child_key(index): existing
+            for index, (child, existing)
+            in enumerate(zip(old.children, widget.children))
+        }
+
+        widgets = []
+        for index, child in enumerate(self.children):
+            existing = current.get(child.child_key(index))
+            if existing is None:
+                widgets.append(child.build())
+            else:
+                widgets.append(child.patch(existing))
+
+        widget.arrange_widgets(widgets)
+
+        if widget.flex in ('v', 'h'):
+            for index, child in enumerate(self.children):
+                if widget.layout.stretch(index) != child.stretch:
+                    widget.layout.setStretch(index, child.stretch)
+
+
+    def child_key(self, index):
+        if self.key is not None:
+            return self.key
+        return (index, self.widget_class)
+
+
+def compile_spec(spec):
+    if isinstance(spec, TBlueprint):
+        return spec
+    if not isinstance(spec, dict):
+        raise TypeError(
+            f'blueprint spec must be a dict, not {type(spec).__name__}'
+        )
+
+    children = tuple(compile_spec(child) for child in spec.get('children', ()))
+    try:
+        cache_key = (
+            _freeze({k: v for k, v in spec.items() if k != 'children'}),
+            children
+        )
+    except TypeError:
+        return _compile(spec, children)
+
+    blueprint = _compiled.get(cache_key)
+    if blueprint is None:
+        blueprint = _compile(spec, children)
+        if len(_compiled) >= CACHE_SIZE:
+            del _compiled[next(iter(_compiled))]
+        _compiled[cache_key] = blueprint
+    return blueprint
+
+
+def build(spec):
+    return compile_spec(spec).build()
+
+
+def patch(widget, spec):
+    return compile_spec(spec).patch(widget)
+
+
+def _compile(spec, children):
+    unknown = spec.keys() - SPEC_KEYS
+    if unknown:
+        raise ValueError(f'unknown blueprint spec keys: {sorted(unknown)}')
+
+    widget_class = spec.get('type', TFlexFrame)
+    if not (
+        isinstance(widget_class, type) and issubclass(widget_class, QWidget)
+    ):
+        raise TypeError(
+            f'blueprint type must be a QWidget subclass, not {widget_class!r}'
+        )
+
+    props = dict(spec.get('props', {}))
+    if issubclass(widget_class, TFlexFrame):
+        _validate_frame_props(props)
+
+    if children and not issubclass(widget_class, TFlexFrame):
+        raise ValueError(
+            f'{widget_class.__name__} cannot hold blueprint children'
+        )
+
+    keys = [child.key for child in children if child.key is not None]
+    if len(keys) != len(set(keys)):
+        raise ValueError(f'duplicate child keys under {widget_class.__name__}')
+
+    stretch = spec.get('stretch', 0)
+    if not isinstance(stretch, int):
+        raise TypeError(f'stretch must be an int, not {stretch!r}')
+
+    return TBlueprint(
+        widget_class,
+        key=spec.get('key'),
+        props=props,
+        children=children,
+        stretch=stretch
+    )
+
+
+def _validate_frame_props(props):
+    if props.get('flex', 'v') not in FLEXES:
+        raise ValueError(f'flex must be one of {sorted(FLEXES)}')
+
+    size_policy = props.get('size_policy', 'xy')
+    if size_policy is not None and size_policy not in SIZE_POLICIES:
+        raise ValueError(f'size_policy must be one of {sorted(SIZE_POLICIES)}')
+
+    scrollbar = props.get('scrollbar')
+    if scrollbar is not None and scrollbar not in SCROLLBAR_POLICIES:
+        raise ValueError(
+            f'scrollbar must be one of {sorted(SCROLLBAR_POLICIES)}'
+        )
+
+    frame_style = props.get('frame_style')
+    if frame_style:
+        frame_shape, shadow_style, _, _ = frame_style
+        if frame_shape not in FRAME_SHAPES:
+            raise ValueError(
+                f'frame shape must be one of {sorted(FRAME_SHAPES)}'
+            )
+        if shadow_style not in SHADOW_STYLES:
+            raise ValueError(
+                f'shadow style must be one of {sorted(SHADOW_STYLES)}'
+            )
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return ('__map__', *sorted(
+            ((key, _freeze(item)) for key, item in value.items()),
+            key=lambda pair: pair[0]
+        ))
+    if isinstance(value, (list, tuple)):
+        return ('__seq__', *(_freeze(item) for item in value))
+    hash(value)
+    return (type(value), value)
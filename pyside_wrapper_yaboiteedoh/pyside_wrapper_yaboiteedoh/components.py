@@ -1,7 +1,26 @@
+import time
+
+_import_started = time.perf_counter()
+
+import concurrent.futures
+import functools
+import inspect
+import json
+import logging
+import queue
+import sys
+import threading
+import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+
 from PySide6.QtCore import (
     Qt,
     Signal,
-    QObject
+    QObject,
+    QTimer,
+    QEvent
 )
 from PySide6.QtGui import (
     QAction,
@@ -14,6 +33,7 @@ from PySide6.QtWidgets import (
     QFrame,
     QSizePolicy,
     QScrollArea,
+    QAbstractScrollArea,
     QVBoxLayout,
     QHBoxLayout,
     QGridLayout,
@@ -21,6 +41,10 @@ from PySide6.QtWidgets import (
     QCheckBox
 )
 
+from .profiling import profiled, TLifetimeTracker
+
+IMPORT_TIME = time.perf_counter() - _import_started
+
 
 PRIORITIES = {
     'low': QAction.Priority.LowPriority,
@@ -44,8 +68,134 @@ SHADOW_STYLES = {
     'sunken': QFrame.Shadow.Sunken
 }
 
+SIZE_POLICIES = {
+    'xy': (QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding),
+    'x': (QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum),
+    'y': (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding),
+    '': (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
+}
+
+SCROLLBAR_POLICIES = {
+    'v': (
+        Qt.ScrollBarPolicy.ScrollBarAsNeeded,
+        Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+    ),
+    'h': (
+        Qt.ScrollBarPolicy.ScrollBarAlwaysOff,
+        Qt.ScrollBarPolicy.ScrollBarAsNeeded
+    ),
+    'both': (
+        Qt.ScrollBarPolicy.ScrollBarAsNeeded,
+        Qt.ScrollBarPolicy.ScrollBarAsNeeded
+    )
+}
+
+FLEX_LAYOUTS = {
+    'v': QVBoxLayout,
+    'h': QHBoxLayout
+}
+
+EXECUTORS = {
+    'thread': 'ThreadPoolExecutor',
+    'process': 'ProcessPoolExecutor'
+}
+
+REENTRANCY = {'queue', 'drop', 'cancel'}
+
+FRAME_BUCKETS = [8, 16, 33, 50, 100, 250, 500, 1000]
+
+logger = logging.getLogger(__name__)
+
+
+def async_slot(func):
+    if not inspect.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    def schedule(*args, **kwargs):
+        from .asyncio_bridge import TAsyncioBridge
+
+        bridge = TAsyncioBridge.current
+        if bridge is None:
+            raise RuntimeError(
+                f'{func.__qualname__} is a coroutine; start TApp.exec_async first'
+            )
+        return bridge.schedule(func(*args, **kwargs))
+    return schedule
+
+
+@functools.lru_cache(maxsize=1024)
+def key_sequence(shortcut):
+    return QKeySequence(shortcut)
+
+
+@functools.lru_cache(maxsize=1024)
+def shortcut_key(shortcut):
+    return key_sequence(shortcut).toString(
+        QKeySequence.SequenceFormat.PortableText
+    )
+
+
+@functools.cache
+def shared_executor(kind):
+    return getattr(concurrent.futures, EXECUTORS[kind])()
+
+
+def set_style_class(widget, style_class):
+    if widget.property('style_class') == style_class:
+        return
+
+    widget.setProperty('style_class', style_class)
+    if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
+def search_text(widget):
+    text = getattr(widget, 'text', '')
+    if callable(text):
+        text = text()
+    return text or ''
+
+
+def rebind_widget(widget, obj):
+    bind = getattr(widget, 'bind', None)
+    if bind is not None:
+        bind(**obj)
+        return
+
+    cls = type(widget)
+    setters = [(_rebind_setter(cls, key), key, value) for key, value in obj.items()]
+    missing = [key for setter, key, _ in setters if setter is None]
+    if missing:
+        raise TypeError(
+            f'{cls.__name__} cannot rebind {missing}: '
+            'define bind() or expose them as properties'
+        )
+
+    for setter, key, value in setters:
+        if setter == 'attribute':
+            setattr(widget, key, value)
+        else:
+            widget.setProperty(key, value)
+
+
+@functools.cache
+def _rebind_setter(cls, key):
+    if isinstance(getattr(cls, key, None), property):
+        return 'attribute'
+    if cls.staticMetaObject.indexOfProperty(key) >= 0:
+        return 'property'
+    return None
+
 
 class TAction(QAction):
+    finished = Signal(object)
+    failed = Signal(object)
+    cancelled = Signal()
+    _completed = Signal(object)
+
     def __init__(
         self,
         text,
@@ -57,12 +207,35 @@ class TAction(QAction):
         menu=None,
         group=None,
         auto_repeat=False,
-        checkable=False
+        checkable=False,
+        executor=None,
+        reentrancy='queue',
+        throttle=0
     ):
         super().__init__(
             text,
             parent
         )
+        if reentrancy not in REENTRANCY:
+            raise ValueError(f'reentrancy must be one of {sorted(REENTRANCY)}')
+        if executor is not None:
+            if not isinstance(executor, Executor) and executor not in EXECUTORS:
+                raise ValueError(
+                    f'executor must be an Executor or one of {sorted(EXECUTORS)}'
+                )
+            if inspect.iscoroutinefunction(func):
+                raise ValueError(
+                    'coroutine callbacks run on the asyncio bridge, not an executor'
+                )
+
+        self.func = func
+        self.executor = executor
+        self.reentrancy = reentrancy
+        self.throttle = throttle
+        self._future = None
+        self._queued = 0
+        self._last_dispatch = None
+
         if group:
             self.setActionGroup(group)
         if auto_repeat:
@@ -74,46 +247,544 @@ class TAction(QAction):
         if priority:
             self.setPriority(PRIORITIES[priority])
         if shortcut:
-            self.setShortcut(QKeySequence(shortcut))
+            self.setShortcut(key_sequence(shortcut))
         if func:
-            self.triggered.connect(func, type=connection_type)
+            self._slot = profiled(f'TAction[{text}]')(async_slot(func))
+            if executor is None and not throttle:
+                self.triggered.connect(self._slot, type=connection_type)
+            else:
+                self._completed.connect(self._complete)
+                self.triggered.connect(self._dispatch, type=connection_type)
         if parent:
             parent.addAction(self)
 
 
+    @property
+    def running(self):
+        return self._future is not None
+
+
     def ping(self):
         self.triggered.emit()
 
 
+    def _dispatch(self, *args):
+        if self.throttle:
+            now = time.perf_counter()
+            last = self._last_dispatch
+            if last is not None and (now - last) * 1000 < self.throttle:
+                return
+            self._last_dispatch = now
+
+        if self.executor is None:
+            self._slot()
+            return
+
+        if self._future is not None:
+            match self.reentrancy:
+                case 'drop':
+                    return
+                case 'queue':
+                    self._queued += 1
+                    return
+                case 'cancel':
+                    previous, self._future = self._future, None
+                    previous.cancel()
+                    self.cancelled.emit()
+        self._submit()
+
+
+    def _submit(self):
+        executor = self.executor
+        if not isinstance(executor, Executor):
+            executor = shared_executor(executor)
+        future = self._future = executor.submit(self.func)
+        future.add_done_callback(self._notify)
+
+
+    def _notify(self, future):
+        # runs on the worker thread; the action may be gone by now
+        try:
+            self._completed.emit(future)
+        except RuntimeError:
+            pass
+
+
+    def _complete(self, future):
+        if future is not self._future:
+            return
+
+        self._future = None
+        error = future.exception()
+        if error is not None:
+            self.failed.emit(error)
+        else:
+            self.finished.emit(future.result())
+
+        if self._queued:
+            self._queued -= 1
+            self._submit()
+
+
+class TCoalescedSignal(QObject):
+    emitted = Signal(object)
+
+    def __init__(
+        self,
+        slot=None,
+        debounce=0,
+        parent=None
+    ):
+        super().__init__(parent)
+
+        self._value = None
+        self._pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce)
+        self._timer.timeout.connect(self.flush)
+
+        if slot:
+            self.emitted.connect(async_slot(slot))
+
+
+    @property
+    def debounce(self):
+        return self._timer.interval()
+
+
+    @debounce.setter
+    def debounce(self, value):
+        self._timer.setInterval(value)
+
+
+    @property
+    def pending(self):
+        return self._pending
+
+
+    def emit(self, value=None):
+        self._value = value
+        self._pending = True
+        self._timer.start()
+
+
+    @profiled()
+    def flush(self):
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        value = self._value
+        self._value = None
+        self._pending = False
+        self.emitted.emit(value)
+
+
+    def cancel(self):
+        self._timer.stop()
+        self._value = None
+        self._pending = False
+
+
+class TTheme:
+    def __init__(self, app=None):
+        self.app = app
+        self.styles = {}
+        self.stylesheet = ''
+        self._deferred = 0
+
+
+    def register(self, style_class, rules, selector='*'):
+        self.styles[(style_class, selector)] = rules
+        self.apply()
+
+
+    def register_many(self, styles):
+        with self.deferred():
+            for style_class, rules in styles.items():
+                self.register(style_class, rules)
+
+
+    def unregister(self, style_class, selector='*'):
+        self.styles.pop((style_class, selector), None)
+        self.apply()
+
+
+    @contextmanager
+    def deferred(self):
+        self._deferred += 1
+        try:
+            yield self
+        finally:
+            self._deferred -= 1
+        self.apply()
+
+
+    def compile(self):
+        blocks = []
+        for (style_class, selector), rules in self.styles.items():
+            if isinstance(rules, dict):
+                rules = ' '.join(
+                    f'{key}: {value};' for key, value in rules.items()
+                )
+            blocks.append(
+                f'{selector}[style_class~="{style_class}"] {{ {rules} }}'
+            )
+        return '\n'.join(blocks)
+
+
+    def apply(self):
+        if self._deferred:
+            return
+
+        stylesheet = self.compile()
+        if stylesheet == self.stylesheet:
+            return
+
+        self.stylesheet = stylesheet
+        app = self.app or QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(stylesheet)
+
+
+class TWatchdog(QObject):
+    stalled = Signal(object)
+
+    def __init__(
+        self,
+        interval=16,
+        threshold=200,
+        history=2000,
+        max_samples=20,
+        parent=None
+    ):
+        super().__init__(parent)
+
+        self.interval = interval
+        self.threshold = threshold
+        self.max_samples = max_samples
+        self.frame_times = deque(maxlen=history)
+        self.stalls = deque(maxlen=history)
+
+        self._thread_id = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._open = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._heartbeat)
+
+
+    @property
+    def running(self):
+        return self._monitor is not None
+
+
+    def start(self):
+        if self.running:
+            return self
+
+        self._beat = time.perf_counter()
+        self._timer.start(self.interval)
+        self._stop.clear()
+        self._monitor = threading.Thread(
+            target=self._watch,
+            name='TWatchdog',
+            daemon=True
+        )
+        self._monitor.start()
+        return self
+
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+
+
+    def report(self):
+        times = sorted(self.frame_times)
+        if not times:
+            percentiles = dict.fromkeys(['p50_ms', 'p95_ms', 'p99_ms', 'max_ms'])
+        else:
+            percentiles = {
+                'p50_ms': times[len(times) // 2],
+                'p95_ms': times[int(len(times) * 0.95)],
+                'p99_ms': times[int(len(times) * 0.99)],
+                'max_ms': times[-1]
+            }
+
+        histogram = dict.fromkeys([f'<{bound}' for bound in FRAME_BUCKETS], 0)
+        histogram[f'>={FRAME_BUCKETS[-1]}'] = 0
+        for elapsed in times:
+            for bound in FRAME_BUCKETS:
+                if elapsed < bound:
+                    histogram[f'<{bound}'] += 1
+                    break
+            else:
+                histogram[f'>={FRAME_BUCKETS[-1]}'] += 1
+
+        return {
+            'interval_ms': self.interval,
+            'threshold_ms': self.threshold,
+            'frames': len(times),
+            **percentiles,
+            'histogram_ms': histogram,
+            'stalls': list(self.stalls)
+        }
+
+
+    def dump(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.report(), file, indent=2)
+
+
+    def _heartbeat(self):
+        now = time.perf_counter()
+        elapsed = (now - self._beat) * 1000
+        self._beat = now
+        self.frame_times.append(elapsed)
+
+        with self._lock:
+            stall, self._open = self._open, None
+        if elapsed < self.threshold:
+            return
+
+        if stall is None:
+            stall = {'samples': []}
+        stall['started'] = time.time() - elapsed / 1000
+        stall['duration_ms'] = elapsed
+        self.stalls.append(stall)
+        self.stalled.emit(stall)
+
+
+    def _watch(self):
+        poll = self.threshold / 4000
+        while not self._stop.wait(poll):
+            beat = self._beat
+            if (time.perf_counter() - beat) * 1000 < self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack = [
+                f'{entry.filename}:{entry.lineno} {entry.name}'
+                for entry in traceback.extract_stack(frame)
+            ]
+            del frame
+
+            with self._lock:
+                if self._beat != beat:
+                    continue
+                if self._open is None:
+                    self._open = {'samples': []}
+                if len(self._open['samples']) < self.max_samples:
+                    self._open['samples'].append(stack)
+
+
+class TActionRegistry(QObject):
+    def __init__(self, window, parent=None):
+        super().__init__(parent)
+
+        self.window = window
+        self.actions = {}
+        self.shortcuts = {}
+        self.menus = {}
+
+        self._specs = {}
+        self._menu_entries = {}
+
+
+    def __contains__(self, name):
+        return name in self.actions or name in self._specs
+
+
+    def __getitem__(self, name):
+        return self.action(name)
+
+
+    def __len__(self):
+        return len(self.actions) + len(self._specs)
+
+
+    def declare(self, table):
+        table = dict(table)
+        conflicts = []
+        shortcuts = {}
+        for name, spec in table.items():
+            if name in self:
+                conflicts.append(f'{name!r} is already registered')
+            shortcut = spec.get('shortcut')
+            if not shortcut:
+                continue
+
+            key = shortcut_key(shortcut)
+            owner = self.shortcuts.get(key) or shortcuts.get(key)
+            if owner is not None:
+                conflicts.append(f'{name!r} and {owner!r} both use {key}')
+            shortcuts[key] = name
+        if conflicts:
+            raise ValueError('; '.join(conflicts))
+
+        self.shortcuts.update(shortcuts)
+        for name, spec in table.items():
+            self._specs[name] = spec
+            if spec.get('menu'):
+                self._menu_entries.setdefault(
+                    self.menu(spec['menu']),
+                    []
+                ).append(name)
+            if spec.get('shortcut'):
+                self.action(name)
+
+
+    def register(self, name, action, menu=None):
+        if name in self:
+            raise ValueError(f'{name!r} is already registered')
+
+        key = action.shortcut().toString(QKeySequence.SequenceFormat.PortableText)
+        if key:
+            owner = self.shortcuts.get(key)
+            if owner is not None:
+                raise ValueError(f'{name!r} and {owner!r} both use {key}')
+            self.shortcuts[key] = name
+
+        self.actions[name] = action
+        if menu:
+            self.menu(menu).addAction(action)
+        return action
+
+
+    def action(self, name):
+        action = self.actions.get(name)
+        if action is not None:
+            return action
+
+        spec = dict(self._specs.pop(name))
+        spec.pop('menu', None)
+        text = spec.pop('text', name)
+        action = self.actions[name] = TAction(text, parent=self.window, **spec)
+        return action
+
+
+    def find(self, shortcut):
+        return self.shortcuts.get(shortcut_key(shortcut))
+
+
+    def ping(self, name):
+        self.action(name).ping()
+
+
+    def trigger_shortcut(self, shortcut):
+        name = self.find(shortcut)
+        if name is None:
+            return False
+        self.ping(name)
+        return True
+
+
+    def menu(self, path):
+        menu = self.menus.get(path)
+        if menu is not None:
+            return menu
+
+        parent, _, title = path.rpartition('/')
+        owner = self.menu(parent) if parent else self.window.menuBar()
+        menu = self.menus[path] = owner.addMenu(title)
+        menu.aboutToShow.connect(functools.partial(self._fill, menu))
+        return menu
+
+
+    def _fill(self, menu):
+        names = self._menu_entries.pop(menu, None)
+        if names:
+            menu.addActions([self.action(name) for name in names])
+
+
 class TApp(QObject):
     def __init__(
         self,
         title='Teedoh Pyside Wrapper Application',
-        geometry=[]
+        geometry=[],
+        deferred=False
     ):
         super().__init__()
 
-        self.app = QApplication([])
+        self._started = time.perf_counter()
+        self.startup = {
+            'import': IMPORT_TIME,
+            'app': None,
+            'first_paint': None
+        }
+
+        self.app = QApplication.instance() or QApplication([])
+        self.theme = TTheme(self.app)
+        self.watchdog = None
         self.window = QMainWindow()
 
         self.menu = self.window.menuBar()
-        self.file_menu = self.menu.addMenu('&File')
-
-        self.force_close = TAction(
-            'Exit Application',
-            shortcut='Ctrl+d',
-            priority='high',
-            connection_type=Qt.DirectConnection,
-            parent=self.file_menu,
-            func=self.window.close
+        self.actions = TActionRegistry(self.window, parent=self)
+        self.file_menu = self.actions.menu('&File')
+
+        self.force_close = self.actions.register(
+            'force_close',
+            TAction(
+                'Exit Application',
+                shortcut='Ctrl+d',
+                priority='high',
+                connection_type=Qt.DirectConnection,
+                parent=self.file_menu,
+                func=self.window.close
+            )
         )
         if title:
             self.window.setWindowTitle(title)
         if geometry:
             self.window.setGeometry(*geometry)
 
-        self.window.show()
+        self.window.installEventFilter(self)
+        self.startup['app'] = time.perf_counter() - self._started
+
+        if not deferred:
+            self.show()
+
+
+    def show(self):
+        if self.window.isVisible():
+            return
         self.window.setWindowState(Qt.WindowMaximized)
+        self.window.show()
+
+
+    def declare_actions(self, table):
+        self.actions.declare(table)
+
+
+    def register_style(self, style_class, rules, selector='*'):
+        self.theme.register(style_class, rules, selector=selector)
+
+
+    def register_styles(self, styles):
+        self.theme.register_many(styles)
+
+
+    def start_watchdog(self, path=None, **kwargs):
+        if self.watchdog is None:
+            self.watchdog = TWatchdog(parent=self, **kwargs)
+            self.app.aboutToQuit.connect(self.watchdog.stop)
+            if path:
+                self.app.aboutToQuit.connect(
+                    functools.partial(self.watchdog.dump, path)
+                )
+        return self.watchdog.start()
 
 
     def surrender(self):
@@ -121,9 +792,305 @@ class TApp(QObject):
 
 
     def exec(self):
+        self.show()
         self.app.exec()
 
 
+    def exec_async(self, main=None):
+        from .asyncio_bridge import TAsyncioBridge
+
+        bridge = TAsyncioBridge(parent=self)
+        if main is not None:
+            bridge.schedule(main)
+
+        self.show()
+        try:
+            self.app.exec()
+        finally:
+            bridge.close()
+
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Type.Paint:
+            self.startup['first_paint'] = time.perf_counter() - self._started
+            self.window.removeEventFilter(self)
+        return False
+
+
+    def startup_report(self):
+        return {
+            stage: None if elapsed is None else round(elapsed * 1e3, 3)
+            for stage, elapsed in self.startup.items()
+        }
+
+
+class TWidgetPool:
+    def __init__(self, max_size=256, parent=None):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._lru = OrderedDict()
+        self._free = {}
+
+        self._park = QWidget(parent)
+        self._park.hide()
+
+
+    def __len__(self):
+        return len(self._lru)
+
+
+    def acquire(self, blueprint_class, obj):
+        free = self._free.get(blueprint_class)
+        if not free:
+            self.misses += 1
+            return blueprint_class(**obj)
+
+        widget = next(reversed(free))
+        rebind_widget(widget, obj)
+        widget.setHidden(False)
+
+        self.hits += 1
+        free.popitem()
+        del self._lru[widget]
+        return widget
+
+
+    def release(self, widget):
+        widget.setParent(self._park)
+
+        blueprint_class = type(widget)
+        self._free.setdefault(blueprint_class, OrderedDict())[widget] = None
+        self._lru[widget] = blueprint_class
+
+        while len(self._lru) > self.max_size:
+            evicted, evicted_class = self._lru.popitem(last=False)
+            del self._free[evicted_class][evicted]
+            evicted.deleteLater()
+
+
+    def clear(self):
+        for widget in self._lru:
+            widget.deleteLater()
+        self._lru = OrderedDict()
+        self._free = {}
+
+
+    @property
+    def stats(self):
+        return {
+            'size': len(self._lru),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+class TLazyWidget(QWidget):
+    def __init__(
+        self,
+        factory,
+        *args,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.factory = factory
+        self.widget = None
+
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setSpacing(0)
+
+
+    @property
+    def built(self):
+        return self.widget is not None
+
+
+    def build(self):
+        if self.widget is None:
+            self.widget = self.factory()
+            self.main_layout.addWidget(self.widget)
+        return self.widget
+
+
+class TPopulateJob(QObject):
+    progress = Signal(int)
+    finished = Signal(int)
+    cancelled = Signal()
+    failed = Signal(object)
+
+    _done = object()
+    idle_interval = 10
+
+    def __init__(
+        self,
+        frame,
+        blueprint_class,
+        source,
+        chunk_size=100,
+        executor=None
+    ):
+        super().__init__(frame)
+
+        self.frame = frame
+        self.blueprint_class = blueprint_class
+        self.source = source
+        self.chunk_size = chunk_size
+        self.count = 0
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._queue = queue.Queue(maxsize=chunk_size * 4)
+        self._cancel = threading.Event()
+        self._running = False
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._deliver)
+
+
+    @property
+    def running(self):
+        return self._running
+
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._running = True
+        self._executor.submit(self._produce)
+        self._timer.start(0)
+
+
+    def cancel(self):
+        if not self._running:
+            return
+        self._cancel.set()
+        self._stop()
+        self.cancelled.emit()
+
+
+    def _produce(self):
+        try:
+            rows = self.source() if callable(self.source) else self.source
+            for row in rows:
+                if not self._put(row):
+                    return
+            self._put(self._done)
+        except Exception as error:
+            self._put(_Failure(error))
+
+
+    def _put(self, item):
+        while not self._cancel.is_set():
+            try:
+                self._queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+    def _deliver(self):
+        rows = []
+        outcome = None
+        while len(rows) < self.chunk_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._done or isinstance(item, _Failure):
+                outcome = item
+                break
+            rows.append(item)
+
+        if rows:
+            with self.frame.batch():
+                for row in rows:
+                    self.frame.add_widget(
+                        self.frame.build_widget(self.blueprint_class, row)
+                    )
+            self.count += len(rows)
+            self.progress.emit(self.count)
+            if not self._running:
+                return
+
+        if outcome is self._done:
+            self._stop()
+            self.finished.emit(self.count)
+        elif outcome is not None:
+            self._stop()
+            self.failed.emit(outcome.error)
+        else:
+            self._timer.setInterval(0 if rows else self.idle_interval)
+
+
+    def _stop(self):
+        self._running = False
+        self._timer.stop()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+        if self.frame._populate_job is self:
+            self.frame._populate_job = None
+        self.deleteLater()
+
+
+class _Failure:
+    def __init__(self, error):
+        self.error = error
+
+
+class TSearchIndex:
+    def __init__(self, entries, key=None, version=None):
+        self.key = key
+        self.version = version
+        self.items = []
+        self.keys = []
+        for item, text in entries:
+            self.items.append(item)
+            self.keys.append(text.casefold())
+
+        self._trigrams = None
+        self._last_query = None
+        self._last_rows = None
+
+
+    def __len__(self):
+        return len(self.items)
+
+
+    def search(self, query):
+        query = query.casefold()
+        if not query:
+            rows = range(len(self.keys))
+        else:
+            keys = self.keys
+            rows = [row for row in self._candidates(query) if query in keys[row]]
+
+        self._last_query = query
+        self._last_rows = rows
+        return rows
+
+
+    def _candidates(self, query):
+        if self._last_query is not None and self._last_query in query:
+            return self._last_rows
+        if len(query) < 3:
+            return range(len(self.keys))
+
+        if self._trigrams is None:
+            self._trigrams = {}
+            for row, key in enumerate(self.keys):
+                for trigram in {key[i:i + 3] for i in range(len(key) - 2)}:
+                    self._trigrams.setdefault(trigram, []).append(row)
+        return min(
+            (self._trigrams.get(query[i:i + 3], ()) for i in range(len(query) - 2)),
+            key=len
+        )
+
+
 class TFlexFrame(QFrame):
     greedy = Signal()
 
@@ -138,6 +1105,9 @@ class TFlexFrame(QFrame):
         label=None,
         accept_drops=False,
         frame_style=['none', 'plain', 0, 0],
+        pool_size=None,
+        breakpoints=None,
+        reflow_delay=50,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
@@ -153,51 +1123,52 @@ class TFlexFrame(QFrame):
             self.setLineWidth(line_width)
             self.setMidLineWidth(mid_line_width)
 
+        self.size_policy = None
         if size_policy is not None:
-            match size_policy:
-                case 'xy':
-                    self.size_policy = [
-                        QSizePolicy.Policy.Expanding,
-                        QSizePolicy.Policy.Expanding
-                    ]
-                case 'x':
-                    self.size_policy = [
-                        QSizePolicy.Policy.Expanding,
-                        QSizePolicy.Policy.Minimum
-                    ]
-                case 'y':
-                    self.size_policy = [
-                        QSizePolicy.Policy.Minimum,
-                        QSizePolicy.Policy.Expanding
-                    ]
-                case '':
-                    self.size_policy = [
-                        QSizePolicy.Policy.Minimum,
-                        QSizePolicy.Policy.Minimum
-                    ]
+            self.size_policy = list(SIZE_POLICIES[size_policy])
 
         self.flex = flex
         self.style_class = style_class
         self.cur_row = 0
         self.cur_column = 0
-        self.max_columns = max_columns
+        self._max_columns = max_columns
+        self._base_columns = max_columns
+
+        self.breakpoints = None
+        self._reflow_timer = None
+        if breakpoints:
+            self.breakpoints = sorted(breakpoints.items())
+            self._reflow_timer = QTimer(self)
+            self._reflow_timer.setSingleShot(True)
+            self._reflow_timer.setInterval(reflow_delay)
+            self._reflow_timer.timeout.connect(self._apply_breakpoints)
 
         self._children = []
+        self._children_cache = ()
+        self._positions = {}
+        self._positions_valid = 0
+        self.children_version = 0
+        self._batch_depth = 0
+        self._focused = None
+        self._focus_dirty = False
+        self._populate_job = None
+        self._search_index = None
+        self._filter_rows = None
+        self._filter_hidden = set()
+
+        self.pool = None
+        if pool_size:
+            self.pool = TWidgetPool(pool_size, parent=self)
 
         self.main_layout = QVBoxLayout(self)
         self.container = QWidget()
 
-        match self.flex:
-            case 'v':
-                self.layout = QVBoxLayout()
-            case 'h':
-                self.layout = QHBoxLayout()
-            case _:
-                self.layout = QGridLayout()
+        self.layout = FLEX_LAYOUTS.get(self.flex, QGridLayout)()
 
         self.container.setLayout(self.layout)
-        self.setSizePolicy(*self.size_policy)
-        self.container.setSizePolicy(*self.size_policy)
+        if self.size_policy is not None:
+            self.setSizePolicy(*self.size_policy)
+            self.container.setSizePolicy(*self.size_policy)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
 
@@ -209,28 +1180,10 @@ class TFlexFrame(QFrame):
             self.scroll = QScrollArea()
             self.scroll.setWidgetResizable(True)
             self.scroll.setWidget(self.container)
-            match scrollbar:
-                case 'v':
-                    self.scroll.setVerticalScrollBarPolicy(
-                        Qt.ScrollBarPolicy.ScrollBarAsNeeded
-                    )
-                    self.scroll.setHorizontalScrollBarPolicy(
-                        Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-                    )
-                case 'h':
-                    self.scroll.setVerticalScrollBarPolicy(
-                        Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-                    )
-                    self.scroll.setHorizontalScrollBarPolicy(
-                        Qt.ScrollBarPolicy.ScrollBarAsNeeded
-                    )
-                case 'both':
-                    self.scroll.setVerticalScrollBarPolicy(
-                        Qt.ScrollBarPolicy.ScrollBarAsNeeded
-                    )
-                    self.scroll.setHorizontalScrollBarPolicy(
-                        Qt.ScrollBarPolicy.ScrollBarAsNeeded
-                    )
+            if scrollbar in SCROLLBAR_POLICIES:
+                vertical, horizontal = SCROLLBAR_POLICIES[scrollbar]
+                self.scroll.setVerticalScrollBarPolicy(vertical)
+                self.scroll.setHorizontalScrollBarPolicy(horizontal)
             self.main_layout.addWidget(self.scroll)
         else:
             self.main_layout.addWidget(self.container)
@@ -238,24 +1191,68 @@ class TFlexFrame(QFrame):
         self.setLayout(self.main_layout)
 
 
+    @profiled()
     def populate(
         self,
         blueprint_class,
         objs
+    ):
+        with self.batch():
+            self.clear_widgets()
+            for obj in objs:
+                self.add_widget(self.build_widget(blueprint_class, obj))
+
+
+    def populate_async(
+        self,
+        blueprint_class,
+        source,
+        chunk_size=100,
+        executor=None
     ):
         self.clear_widgets()
-        for obj in objs:
-            o = blueprint_class(**obj)
-            self.add_widget(o)
+        job = self._populate_job = TPopulateJob(
+            self,
+            blueprint_class,
+            source,
+            chunk_size=chunk_size,
+            executor=executor
+        )
+        job.start()
+        return job
+
+
+    def build_widget(self, blueprint_class, obj):
+        if self.pool is not None:
+            return self.pool.acquire(blueprint_class, obj)
+        return blueprint_class(**obj)
+
+
+    @contextmanager
+    def batch(self):
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.setUpdatesEnabled(False)
+            self.layout.setEnabled(False)
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.layout.setEnabled(True)
+                if self.isVisible():
+                    self.layout.activate()
+                self.setUpdatesEnabled(True)
 
     
+    @profiled()
     def add_widget(self, widget, stretch=0):
         match self.flex:
             case 'v' | 'h':
-                print(widget, len(self.children))
+                logger.debug('%s %d', widget, len(self._children))
                 self.layout.addWidget(widget, stretch=stretch)
             case _:
-                print(widget, self.cur_row, self.cur_column)
+                logger.debug('%s %d %d', widget, self.cur_row, self.cur_column)
                 self.layout.addWidget(widget, self.cur_row, self.cur_column)
      
                 self.cur_column += 1
@@ -265,35 +1262,312 @@ class TFlexFrame(QFrame):
                         self.cur_row += 1
                         self.cur_column = 0
 
+        if self._batch_depth and self.container.isVisible():
+            self._show_now(widget)
+
+        if self._positions_valid == len(self._children):
+            self._positions[widget] = self._positions_valid
+            self._positions_valid += 1
         self._children.append(widget)
+        self._touch()
+        if self._focused is not None:
+            self._focus_dirty = True
+        if TLifetimeTracker.current is not None:
+            TLifetimeTracker.current.track(widget)
         return widget
 
 
+    def add_lazy_widget(self, factory, stretch=0):
+        return self.add_widget(TLazyWidget(factory), stretch=stretch)
+
+
+    def _show_now(self, widget):
+        explicitly_hidden = (
+            widget.isHidden()
+            and widget.testAttribute(Qt.WidgetAttribute.WA_WState_ExplicitShowHide)
+        )
+        if not explicitly_hidden:
+            widget.show()
+
+
+    @profiled()
     def remove_widget(self, widget):
-        self.cur_column = 0
-        self.cur_row = 0
+        index = self._position(widget)
+        del self._children[index]
+        del self._positions[widget]
+        self._positions_valid = min(self._positions_valid, index)
+        self._touch()
 
-        for child in self.children:
-            self.layout.removeWidget(child)
-            self._children.remove(child)
+        self._take_item(widget, index)
+        self._discard(widget)
 
-            if child == widget:
-                child.setParent(None)
-                child.deleteLater()
-            else:
-                self.add_widget(child)
+        self._repack(index)
         self.update()
 
 
+    @profiled()
+    def remove_widgets(self, widgets):
+        doomed = set(widgets)
+        if not doomed:
+            return
+
+        first = None
+        survivors = []
+        with self.batch():
+            for index, child in enumerate(self._children):
+                if child in doomed:
+                    if first is None:
+                        first = index
+                    self._take_item(child, len(survivors))
+                    self._discard(child)
+                    self._positions.pop(child, None)
+                else:
+                    survivors.append(child)
+
+            self._children = survivors
+            self._touch()
+            if first is not None:
+                self._positions_valid = min(self._positions_valid, first)
+                self._repack(first)
+        self.update()
+
+
+    @profiled()
+    def arrange_widgets(self, widgets):
+        widgets = list(widgets)
+        keep = set(widgets)
+
+        with self.batch():
+            self.remove_widgets(
+                [child for child in self._children if child not in keep]
+            )
+
+            present = set(self._children)
+            for widget in widgets:
+                if widget not in present:
+                    self.add_widget(widget)
+
+            self._reorder(widgets)
+            self._positions_valid = 0
+            self._touch()
+
+
+    def _reorder(self, widgets):
+        match self.flex:
+            case 'v' | 'h':
+                for index, widget in enumerate(widgets):
+                    if self._children[index] is widget:
+                        continue
+
+                    old = self._children.index(widget, index)
+                    del self._children[old]
+                    self._children.insert(index, widget)
+
+                    stretch = self.layout.stretch(old)
+                    self.layout.insertItem(index, self._take_item(widget, old))
+                    self.layout.setStretch(index, stretch)
+            case _:
+                first = next(
+                    (
+                        index for index, (child, widget)
+                        in enumerate(zip(self._children, widgets))
+                        if child is not widget
+                    ),
+                    None
+                )
+                if first is None:
+                    return
+
+                tail = {}
+                for _ in range(first, self.layout.count()):
+                    item = self.layout.takeAt(self.layout.count() - 1)
+                    tail[item.widget()] = item
+
+                self._children[first:] = widgets[first:]
+                for index in range(first, len(widgets)):
+                    self.layout.addItem(tail[widgets[index]], *self._cell(index))
+
+
+    def _position(self, widget):
+        position = self._positions.get(widget)
+        if position is None or position >= self._positions_valid:
+            children = self._children
+            for index in range(self._positions_valid, len(children)):
+                self._positions[children[index]] = index
+            self._positions_valid = len(children)
+
+            position = self._positions.get(widget)
+            if position is None:
+                raise ValueError(f'{widget!r} is not in {self!r}')
+        return position
+
+
+    def _take_item(self, widget, index):
+        item = self.layout.itemAt(index)
+        if item is None or item.widget() is not widget:
+            index = self.layout.indexOf(widget)
+        return self.layout.takeAt(index)
+
+
+    def _discard(self, widget):
+        if widget is self._focused:
+            self._focused = None
+
+        tracker = TLifetimeTracker.current
+        if self.pool is not None:
+            self.pool.release(widget)
+            if tracker is not None:
+                tracker.pooled(widget)
+            return
+        widget.hide()
+        widget.deleteLater()
+        if tracker is not None:
+            tracker.discarded(widget)
+
+
+    @property
+    def max_columns(self):
+        return self._max_columns
+
+
+    @max_columns.setter
+    def max_columns(self, value):
+        old, self._max_columns = self._max_columns, value
+        if old == value or self.flex in FLEX_LAYOUTS:
+            return
+
+        bounds = [columns for columns in (old, value) if columns]
+        first = min(bounds) if bounds else 0
+        if first < len(self._children):
+            with self.batch():
+                self._repack(first)
+        else:
+            self.cur_row, self.cur_column = self._cell(len(self._children))
+
+
+    def columns_for(self, width):
+        columns = self._base_columns
+        for min_width, breakpoint_columns in self.breakpoints or []:
+            if width < min_width:
+                break
+            columns = breakpoint_columns
+        return columns
+
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._reflow_timer is not None:
+            self._reflow_timer.start()
+
+
+    def _apply_breakpoints(self):
+        self.max_columns = self.columns_for(self.width())
+
+
+    def _cell(self, index):
+        if self.max_columns:
+            return divmod(index, self.max_columns)
+        return 0, index
+
+
+    def _repack(self, start=0):
+        self.cur_row, self.cur_column = self._cell(len(self._children))
+
+        match self.flex:
+            case 'v' | 'h':
+                return
+            case _:
+                tail = [
+                    self.layout.takeAt(self.layout.count() - 1)
+                    for _ in range(start, self.layout.count())
+                ]
+                for index, item in enumerate(reversed(tail), start):
+                    self.layout.addItem(item, *self._cell(index))
+
+
+    @profiled()
     def clear_widgets(self):
-        for child in self.children:
-            self._children.remove(child)
-            child.setParent(None)
-            child.deleteLater()
+        if self._populate_job is not None:
+            self._populate_job.cancel()
+
+        with self.batch():
+            for index in reversed(range(len(self._children))):
+                child = self._children[index]
+                self._take_item(child, index)
+                self._discard(child)
 
         self.cur_column = 0
         self.cur_row = 0
         self._children = []
+        self._positions = {}
+        self._positions_valid = 0
+        self._touch()
+
+
+    def filter_widgets(self, query, key=None):
+        index = self._search_index
+        if (
+            index is None
+            or index.version != self.children_version
+            or index.key is not key
+        ):
+            self.clear_filter()
+            index = self._search_index = TSearchIndex(
+                self._search_entries(key),
+                key=key,
+                version=self.children_version
+            )
+
+        rows = set(index.search(query)) if query else None
+        previous = self._filter_rows
+        if rows != previous:
+            if previous is None:
+                hide = [row for row in range(len(index)) if row not in rows]
+                show = []
+            elif rows is None:
+                hide = []
+                show = [row for row in range(len(index)) if row not in previous]
+            else:
+                hide = previous - rows
+                show = rows - previous
+
+            hidden = self._filter_hidden
+            with self.batch():
+                for row in hide:
+                    widget = index.items[row]
+                    if not widget.isHidden():
+                        widget.setHidden(True)
+                        hidden.add(widget)
+                for row in show:
+                    widget = index.items[row]
+                    if widget in hidden:
+                        hidden.discard(widget)
+                        if self._focused is None or widget is self._focused:
+                            widget.setHidden(False)
+            self._filter_rows = rows
+
+        if rows is None:
+            return list(index.items)
+        return [index.items[row] for row in sorted(rows)]
+
+
+    def clear_filter(self):
+        if self._filter_hidden:
+            alive = set(self._children)
+            with self.batch():
+                for widget in self._filter_hidden:
+                    if widget in alive and (
+                        self._focused is None or widget is self._focused
+                    ):
+                        widget.setHidden(False)
+        self._filter_hidden = set()
+        self._filter_rows = None
+        self._search_index = None
+
+
+    def _search_entries(self, key):
+        key = key or search_text
+        return [(widget, key(widget)) for widget in self._children]
 
 
     def center_widget(self, widget):
@@ -302,15 +1576,291 @@ class TFlexFrame(QFrame):
 
 
     def focus_widget(self, widget):
-        for child in self.children:
-            child.setHidden(True)
-            if child == widget:
-                child.setHidden(False)
+        if isinstance(widget, TLazyWidget):
+            widget.build()
+
+        if self._focused is None or self._focus_dirty:
+            with self.batch():
+                for child in self._children:
+                    if child is not widget:
+                        child.setHidden(True)
+            self._focus_dirty = False
+        elif self._focused is not widget:
+            self._focused.setHidden(True)
+
+        widget.setHidden(False)
+        self._focused = widget
+
+
+    @property
+    def focused(self):
+        return self._focused
+
+
+    def _touch(self):
+        self._children_cache = None
+        self.children_version += 1
+
+
+    @property
+    def style_class(self):
+        return self.property('style_class')
+
+
+    @style_class.setter
+    def style_class(self, value):
+        set_style_class(self, value)
 
 
     @property
     def children(self):
-        return [child for child in self._children]
+        if self._children_cache is None:
+            self._children_cache = tuple(self._children)
+        return self._children_cache
+
+
+class TVirtualFlexFrame(QAbstractScrollArea):
+    greedy = Signal()
+
+    def __init__(
+        self,
+        *args,
+        flex='v',
+        max_columns=None,
+        overscan=2,
+        item_size=None,
+        frame_style=['none', 'plain', 0, 0],
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+
+        if frame_style:
+            frame_shape, shadow_style, line_width, mid_line_width = frame_style
+            self.setFrameStyle(
+                FRAME_SHAPES[frame_shape] | SHADOW_STYLES[shadow_style]
+            )
+            self.setLineWidth(line_width)
+            self.setMidLineWidth(mid_line_width)
+
+        match flex:
+            case 'v' | 'h':
+                pass
+            case _:
+                flex = 'grid'
+
+        self.flex = flex
+        self.max_columns = max_columns
+        self.overscan = overscan
+        self.item_size = item_size
+
+        self._measure = item_size is None
+
+        self._blueprint_class = None
+        self._data = []
+        self._bound = {}
+        self._spares = []
+
+        if self.flex == 'h':
+            self.setVerticalScrollBarPolicy(
+                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+            )
+        else:
+            self.setHorizontalScrollBarPolicy(
+                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+            )
+
+
+    def populate(
+        self,
+        blueprint_class,
+        objs
+    ):
+        if not hasattr(objs, '__getitem__'):
+            objs = list(objs)
+
+        if blueprint_class is not self._blueprint_class:
+            self.clear_widgets()
+            self._blueprint_class = blueprint_class
+            if self._measure:
+                self.item_size = None
+
+        for widget in self._bound.values():
+            widget.hide()
+            self._spares.append(widget)
+        self._bound = {}
+        self._data = objs
+
+        self._sync_scrollbars()
+        self._relayout()
+
+
+    def clear_widgets(self):
+        for widget in [*self._bound.values(), *self._spares]:
+            widget.hide()
+            widget.deleteLater()
+
+        self._bound = {}
+        self._spares = []
+        self._data = []
+        self._sync_scrollbars()
+
+
+    def refresh(self):
+        for index, widget in self._bound.items():
+            rebind_widget(widget, self._data[index])
+
+
+    def scroll_to(self, index):
+        row = index // self._columns()
+        if self.flex == 'h':
+            self.horizontalScrollBar().setValue(row * self._extent()[0])
+        else:
+            self.verticalScrollBar().setValue(row * self._extent()[1])
+
+
+    @property
+    def children(self):
+        return tuple(self._bound[index] for index in sorted(self._bound))
+
+
+    @property
+    def visible_range(self):
+        return self._window()
+
+
+    def _extent(self):
+        if self.item_size is None:
+            if not self._data:
+                return 1, 1
+            probe = self._acquire()
+            rebind_widget(probe, self._data[0])
+            hint = probe.sizeHint()
+            self._spares.append(probe)
+            self.item_size = max(hint.width(), 1), max(hint.height(), 1)
+        return self.item_size
+
+
+    def _columns(self):
+        if self.flex != 'grid':
+            return 1
+        if self.max_columns:
+            return self.max_columns
+        width = self.viewport().width()
+        return max(width // self._extent()[0], 1)
+
+
+    def _lines(self):
+        columns = self._columns()
+        return (len(self._data) + columns - 1) // columns
+
+
+    def _window(self):
+        if not self._data:
+            return range(0)
+
+        width, height = self._extent()
+        if self.flex == 'h':
+            offset = self.horizontalScrollBar().value()
+            span, step = self.viewport().width(), width
+        else:
+            offset = self.verticalScrollBar().value()
+            span, step = self.viewport().height(), height
+
+        columns = self._columns()
+        first = max(offset // step - self.overscan, 0)
+        last = min(
+            (offset + span) // step + 1 + self.overscan,
+            self._lines()
+        )
+        return range(first * columns, min(last * columns, len(self._data)))
+
+
+    def _sync_scrollbars(self):
+        width, height = self._extent()
+        lines = self._lines()
+
+        if self.flex == 'h':
+            bar, span, step = (
+                self.horizontalScrollBar(), self.viewport().width(), width
+            )
+        else:
+            bar, span, step = (
+                self.verticalScrollBar(), self.viewport().height(), height
+            )
+
+        bar.setRange(0, max(lines * step - span, 0))
+        bar.setPageStep(span)
+        bar.setSingleStep(step)
+
+
+    def _acquire(self):
+        if self._spares:
+            return self._spares.pop()
+        widget = self._blueprint_class(**self._data[0])
+        widget.setParent(self.viewport())
+        return widget
+
+
+    def _relayout(self):
+        window = self._window()
+
+        for index in [index for index in self._bound if index not in window]:
+            widget = self._bound.pop(index)
+            widget.hide()
+            self._spares.append(widget)
+
+        width, height = self._extent()
+        columns = self._columns()
+        if self.flex == 'grid' and self.max_columns:
+            width = self.viewport().width() // columns
+
+        h_offset = self.horizontalScrollBar().value()
+        v_offset = self.verticalScrollBar().value()
+
+        for index in window:
+            widget = self._bound.get(index)
+            if widget is None:
+                widget = self._acquire()
+                rebind_widget(widget, self._data[index])
+                self._bound[index] = widget
+
+            match self.flex:
+                case 'v':
+                    widget.setGeometry(
+                        0,
+                        index * height - v_offset,
+                        self.viewport().width(),
+                        height
+                    )
+                case 'h':
+                    widget.setGeometry(
+                        index * width - h_offset,
+                        0,
+                        width,
+                        self.viewport().height()
+                    )
+                case _:
+                    row, column = divmod(index, columns)
+                    widget.setGeometry(
+                        column * width,
+                        row * height - v_offset,
+                        width,
+                        height
+                    )
+            widget.show()
+
+        for widget in self._spares:
+            widget.hide()
+
+
+    def scrollContentsBy(self, dx, dy):
+        self._relayout()
+
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._sync_scrollbars()
+        self._relayout()
 
 
 class TCheckBox(QCheckBox):
@@ -328,7 +1878,7 @@ class TCheckBox(QCheckBox):
 
     @property
     def text(self):
-        return self.text()
+        return QCheckBox.text(self)
 
 
     @text.setter
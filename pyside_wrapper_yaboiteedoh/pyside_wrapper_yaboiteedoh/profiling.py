@@ -0,0 +1,290 @@
+import functools
+import json
+import os
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+
+STALL_MS = 50
+TRACE_SIZE = 100_000
+
+
+def profiled(name=None):
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = TProfiler.current
+            if profiler is None:
+                return func(*args, **kwargs)
+
+            profiler._depth += 1
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler._depth -= 1
+                profiler.record(label, start, perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+class TProfiler:
+    current = None
+
+    def __init__(
+        self,
+        stall_ms=STALL_MS,
+        trace_size=TRACE_SIZE
+    ):
+        self.stall_ms = stall_ms
+        self.counts = {}
+        self.totals = {}
+        self.maxima = {}
+        self.histograms = {}
+        self.stalls = []
+        self.trace = deque(maxlen=trace_size)
+        self._depth = 0
+
+
+    def enable(self):
+        TProfiler.current = self
+        return self
+
+
+    def disable(self):
+        if TProfiler.current is self:
+            TProfiler.current = None
+
+
+    @property
+    def enabled(self):
+        return TProfiler.current is self
+
+
+    @contextmanager
+    def recording(self):
+        previous = TProfiler.current
+        TProfiler.current = self
+        try:
+            yield self
+        finally:
+            TProfiler.current = previous
+
+
+    @contextmanager
+    def span(self, name):
+        self._depth += 1
+        start = perf_counter_ns()
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            self.record(name, start, perf_counter_ns() - start)
+
+
+    def record(self, name, start, duration):
+        if name in self.counts:
+            self.counts[name] += 1
+            self.totals[name] += duration
+            if duration > self.maxima[name]:
+                self.maxima[name] = duration
+        else:
+            self.counts[name] = 1
+            self.totals[name] = duration
+            self.maxima[name] = duration
+            self.histograms[name] = {}
+
+        bucket = (duration // 1000).bit_length()
+        histogram = self.histograms[name]
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+        tid = threading.get_ident()
+        self.trace.append((name, start, duration, tid))
+        if not self._depth and duration >= self.stall_ms * 1_000_000:
+            self.stalls.append((name, start, duration, tid))
+
+
+    def reset(self):
+        self.counts = {}
+        self.totals = {}
+        self.maxima = {}
+        self.histograms = {}
+        self.stalls = []
+        self.trace.clear()
+
+
+    def stats(self):
+        return {
+            name: {
+                'count': count,
+                'total_ms': self.totals[name] / 1e6,
+                'mean_ms': self.totals[name] / count / 1e6,
+                'max_ms': self.maxima[name] / 1e6,
+                'histogram_us': {
+                    f'<{1 << bucket}': self.histograms[name][bucket]
+                    for bucket in sorted(self.histograms[name])
+                }
+            }
+            for name, count in self.counts.items()
+        }
+
+
+    def to_json(self, path=None):
+        data = {
+            'stall_ms': self.stall_ms,
+            'spans': self.stats(),
+            'stalls': [
+                {'name': name, 'duration_ms': duration / 1e6, 'thread': tid}
+                for name, _, duration, tid in self.stalls
+            ]
+        }
+        if path is not None:
+            with open(path, 'w') as file:
+                json.dump(data, file, indent=2)
+        return data
+
+
+    def to_chrome_trace(self, path=None):
+        pid = os.getpid()
+        events = [
+            {
+                'name': name,
+                'cat': 'pyside_wrapper',
+                'ph': 'X',
+                'ts': start / 1000,
+                'dur': duration / 1000,
+                'pid': pid,
+                'tid': tid
+            }
+            for name, start, duration, tid in self.trace
+        ]
+        events.extend(
+            {
+                'name': f'stall: {name}',
+                'cat': 'stall',
+                'ph': 'i',
+                's': 't',
+                'ts': (start + duration) / 1000,
+                'pid': pid,
+                'tid': tid
+            }
+            for name, start, duration, tid in self.stalls
+        )
+        data = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        if path is not None:
+            with open(path, 'w') as file:
+                json.dump(data, file)
+        return data
+
+
+class _Lifetime:
+    __slots__ = ('name', 'state', 'cpp_alive', 'ref')
+
+    def __init__(self, name):
+        self.name = name
+        self.state = 'attached'
+        self.cpp_alive = True
+        self.ref = None
+
+
+class TLifetimeTracker:
+    current = None
+
+    def __init__(self):
+        self.created = 0
+        self.records = {}
+        self._keys = weakref.WeakKeyDictionary()
+
+
+    def enable(self):
+        TLifetimeTracker.current = self
+        return self
+
+
+    def disable(self):
+        if TLifetimeTracker.current is self:
+            TLifetimeTracker.current = None
+
+
+    @contextmanager
+    def tracking(self):
+        previous = TLifetimeTracker.current
+        TLifetimeTracker.current = self
+        try:
+            yield self
+        finally:
+            TLifetimeTracker.current = previous
+
+
+    def track(self, widget):
+        key = self._keys.get(widget)
+        if key is not None:
+            self.records[key].state = 'attached'
+            return
+
+        key = self.created
+        self.created += 1
+        self._keys[widget] = key
+
+        record = self.records[key] = _Lifetime(type(widget).__qualname__)
+        record.ref = weakref.ref(widget, functools.partial(self._collected, key))
+        widget.destroyed.connect(functools.partial(self._destroyed, key))
+
+
+    def discarded(self, widget):
+        self._mark(widget, 'discarded')
+
+
+    def pooled(self, widget):
+        self._mark(widget, 'pooled')
+
+
+    def report(self):
+        groups = {}
+        for record in self.records.values():
+            if not record.cpp_alive:
+                status = 'zombie'
+            elif record.state == 'discarded':
+                status = 'leaked'
+            else:
+                status = record.state
+            group = groups.setdefault(
+                record.name,
+                dict.fromkeys(['attached', 'pooled', 'leaked', 'zombie'], 0)
+            )
+            group[status] += 1
+        return groups
+
+
+    def leaks(self):
+        return {
+            name: group['leaked'] + group['zombie']
+            for name, group in self.report().items()
+            if group['leaked'] or group['zombie']
+        }
+
+
+    def _mark(self, widget, state):
+        key = self._keys.get(widget)
+        if key is not None:
+            self.records[key].state = state
+
+
+    def _destroyed(self, key, *args):
+        record = self.records.get(key)
+        if record is None:
+            return
+        record.cpp_alive = False
+        if record.ref() is None:
+            del self.records[key]
+
+
+    def _collected(self, key, ref):
+        record = self.records.get(key)
+        if record is not None and not record.cpp_alive:
+            del self.records[key]
@@ -1,11 +1,23 @@
-from PySide6.QtCore import Signal
+from contextlib import contextmanager
+from itertools import compress
+from operator import ne
+
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QAbstractListModel,
+    QModelIndex
+)
 from PySide6.QtWidgets import (
+    QAbstractButton,
     QLabel,
     QLineEdit,
+    QListView,
     QRadioButton
 )
 
-from .components import TFlexFrame, TCheckBox
+from .components import TFlexFrame, TCheckBox, TCoalescedSignal
+from .profiling import profiled
 
 
 class TLabeledInput(TFlexFrame):
@@ -50,8 +62,162 @@ class TLabeledInput(TFlexFrame):
         return self.input.setText(value)
 
 
-class TRadioMenu(TFlexFrame):
-    selectionChanged = Signal(str)
+class TOptionStore:
+    __slots__ = (
+        'labels',
+        'items',
+        'checked',
+        'version',
+        'exclusive'
+    )
+
+    def __init__(self, labels=(), exclusive=False):
+        self.labels = []
+        self.items = []
+        self.checked = bytearray()
+        self.version = 0
+        self.exclusive = exclusive
+
+        self.arrange(labels)
+
+
+    def __len__(self):
+        return len(self.labels)
+
+
+    def __iter__(self):
+        return iter(self.labels)
+
+
+    def __contains__(self, label):
+        return label in self.labels
+
+
+    def find(self, label):
+        try:
+            return self.labels.index(label)
+        except ValueError:
+            return None
+
+
+    def item(self, label):
+        row = self.find(label)
+        if row is not None:
+            return self.items[row]
+
+
+    def is_checked(self, label):
+        row = self.find(label)
+        return row is not None and bool(self.checked[row])
+
+
+    def add(self, label, item=None, checked=False):
+        row = len(self.labels)
+        self.labels.append(label)
+        self.items.append(item)
+        self.checked.append(0)
+        if checked:
+            self.set_row(row, True)
+        return row
+
+
+    def discard(self, labels, items=None):
+        if items is None:
+            doomed, column = set(labels), self.labels
+        else:
+            doomed, column = set(items), self.items
+        keep = bytearray(value not in doomed for value in column)
+
+        if all(keep):
+            return False
+
+        checked = self.checked.count(1)
+        self.labels = list(compress(self.labels, keep))
+        self.items = list(compress(self.items, keep))
+        self.checked = bytearray(compress(self.checked, keep))
+        if self.checked.count(1) != checked:
+            self.version += 1
+            return True
+        return False
+
+
+    def arrange(self, labels):
+        labels = list(dict.fromkeys(labels))
+        rows = dict(zip(self.labels, range(len(self.labels))))
+        rows = list(map(rows.get, labels))
+        checked = self.checked.count(1)
+
+        self.items = [None if row is None else self.items[row] for row in rows]
+        self.checked = bytearray(
+            0 if row is None else self.checked[row] for row in rows
+        )
+        self.labels = labels
+        if self.checked.count(1) != checked:
+            self.version += 1
+
+
+    def clear(self):
+        if any(self.checked):
+            self.version += 1
+        self.labels = []
+        self.items = []
+        self.checked = bytearray()
+
+
+    def set_checked(self, label, active):
+        row = self.find(label)
+        if row is None:
+            return False
+        return bool(self.set_row(row, active))
+
+
+    def set_row(self, row, active):
+        if self.checked[row] == active:
+            return []
+
+        changed = [row]
+        if active and self.exclusive:
+            previous = self.checked.find(1)
+            if previous >= 0:
+                self.checked[previous] = 0
+                changed = sorted([previous, row])
+        self.checked[row] = active
+        self.version += 1
+        return changed
+
+
+    def assign(self, labels):
+        if self.exclusive:
+            target = bytearray(len(self.labels))
+            for label in reversed(list(labels)):
+                row = self.find(label)
+                if row is not None:
+                    target[row] = 1
+                    break
+        else:
+            wanted = set(labels)
+            target = bytearray(map(wanted.__contains__, self.labels))
+
+        changed = list(compress(range(len(target)), map(ne, self.checked, target)))
+        if changed:
+            self.checked = target
+            self.version += 1
+        return changed
+
+
+    def selected(self):
+        return list(compress(self.labels, self.checked))
+
+
+    def first(self):
+        row = self.checked.find(1)
+        if row >= 0:
+            return self.labels[row]
+
+
+class TOptionFrame(TFlexFrame):
+    option_class = QAbstractButton
+    exclusive = False
 
     def __init__(
         self,
@@ -59,6 +225,7 @@ class TRadioMenu(TFlexFrame):
         options=[],
         default='',
         size_policy='',
+        debounce=0,
         **kwargs
     ):
         super().__init__(
@@ -67,104 +234,365 @@ class TRadioMenu(TFlexFrame):
             **kwargs
         )
 
+        self.store = TOptionStore(exclusive=self.exclusive)
+        self._bulk = False
+        self.selection_signal = TCoalescedSignal(
+            self.selectionChanged.emit,
+            debounce=debounce,
+            parent=self
+        )
+
         self.options = options
         if default:
             self.value = default
+        self.selection_signal.cancel()
 
 
     @property
     def options(self):
-        return [option.text() for option in self._children]
+        return list(self.store)
 
 
     @options.setter
+    @profiled()
     def options(self, options: list[str]):
-        selection = self.value
+        options = list(dict.fromkeys(options))
+        existing = dict(zip(self.store.labels, self.store.items))
+        widgets = []
+        for option in options:
+            widget = existing.get(option)
+            if widget is None:
+                widget = self.option_class(text=option)
+            widgets.append(widget)
+
+        with self.bulk():
+            self.arrange_widgets(widgets)
+            self.store.arrange(options)
+
+
+    @contextmanager
+    def bulk(self):
+        outer = self._bulk
+        before = self.store.version
+        self._bulk = True
+        try:
+            yield self
+        finally:
+            self._bulk = outer
+        if not outer and self.store.version != before:
+            self.emit_selection()
+
+
+    def add_widget(self, widget, stretch=0):
+        super().add_widget(widget, stretch=stretch)
+
+        text = QAbstractButton.text(widget)
+        self.store.add(text, widget, checked=widget.isChecked())
+        widget.toggled.connect(self._option_toggled)
+        return widget
+
+
+    def remove_widget(self, widget):
+        self._forget([widget])
+        super().remove_widget(widget)
+
+
+    def remove_widgets(self, widgets):
+        widgets = list(widgets)
+        self._forget(widgets)
+        super().remove_widgets(widgets)
+
+
+    def clear_widgets(self):
+        for widget in self._children:
+            widget.toggled.disconnect(self._option_toggled)
+        self.store.clear()
+        super().clear_widgets()
+
+
+    def _search_entries(self, key):
+        if key is not None:
+            return super()._search_entries(key)
+        return zip(self.store.items, self.store.labels)
 
-        self.clear_widgets()
 
-        self.populate(
-            QRadioButton,
-            [{'text': option} for option in options]
+    def _forget(self, widgets):
+        self.store.discard(
+            [QAbstractButton.text(widget) for widget in widgets],
+            widgets
         )
-        for option in self._children:
-            option.toggled.connect(
-                lambda active, o=option.text(): self.update_value(active, o)
-            )
+        for widget in widgets:
+            widget.toggled.disconnect(self._option_toggled)
 
-        self.value = selection
 
+    def _option_toggled(self, active):
+        text = QAbstractButton.text(self.sender())
+        changed = self.store.set_checked(text, active)
+        if changed and (active or not self.exclusive) and not self._bulk:
+            self.emit_selection()
+
+
+class TRadioMenu(TOptionFrame):
+    selectionChanged = Signal(str)
+    option_class = QRadioButton
+    exclusive = True
 
     @property
     def value(self):
-        for option in self.children:
-            if option.isChecked():
-                return option.text()
+        return self.store.first()
 
 
     @value.setter
+    @profiled()
     def value(self, value):
-        if value in self.options:
-            for option in self._children:
-                if option.text() == value:
-                    option.setChecked(True)
-                    self.selectionChanged.emit(option.text())
-    
+        option = self.store.item(value)
+        if option is not None:
+            option.setChecked(True)
+
+
+    def emit_selection(self):
+        value = self.value
+        if value is not None:
+            self.selection_signal.emit(value)
+
+
+class TCheckBoxMatrix(TOptionFrame):
+    selectionChanged = Signal(list)
+    option_class = TCheckBox
+
+    @property
+    def value(self):
+        return self.store.selected()
+
+
+    @value.setter
+    def value(self, values):
+        self.set_values(values)
+
+
+    @profiled()
+    def set_values(self, values):
+        with self.bulk():
+            for row in self.store.assign(values):
+                self.store.items[row].setChecked(bool(self.store.checked[row]))
+
+
+    def emit_selection(self):
+        self.selection_signal.emit(self.value)
 
-    def update_value(self, active, value):
-        if active:
-            self.selectionChanged.emit(value)
 
+class TOptionModel(QAbstractListModel):
+    checkedChanged = Signal()
+
+    def __init__(
+        self,
+        options=[],
+        exclusive=False,
+        parent=None
+    ):
+        super().__init__(parent)
+
+        self.store = TOptionStore(options, exclusive=exclusive)
+
+
+    @property
+    def exclusive(self):
+        return self.store.exclusive
+
+
+    @property
+    def options(self):
+        return list(self.store)
+
+
+    @options.setter
+    def options(self, options):
+        version = self.store.version
+
+        self.beginResetModel()
+        self.store.arrange(options)
+        self.endResetModel()
+
+        if self.store.version != version:
+            self.checkedChanged.emit()
+
+
+    @property
+    def checked(self):
+        return self.store.selected()
+
+
+    @checked.setter
+    def checked(self, values):
+        self._changed(self.store.assign(values))
+
+
+    def __contains__(self, value):
+        return value in self.store
+
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.store)
+
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                return self.store.labels[index.row()]
+            case Qt.ItemDataRole.CheckStateRole:
+                if self.store.checked[index.row()]:
+                    return Qt.CheckState.Checked
+                return Qt.CheckState.Unchecked
+        return None
+
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        active = Qt.CheckState(value) == Qt.CheckState.Checked
+        if not active and self.exclusive:
+            return False
+
+        self._changed(self.store.set_row(index.row(), active))
+        return True
+
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsUserCheckable
+        )
+
+
+    def _changed(self, rows):
+        if not rows:
+            return
+
+        self.dataChanged.emit(
+            self.index(rows[0]),
+            self.index(rows[-1]),
+            [Qt.ItemDataRole.CheckStateRole]
+        )
+        self.checkedChanged.emit()
+
+
+class TOptionView(QListView):
+    exclusive = False
 
-class TCheckBoxMatrix(TFlexFrame):
     def __init__(
         self,
         *args,
         options=[],
         default='',
-        size_policy='',
+        flex='v',
+        debounce=0,
         **kwargs
     ):
-        super().__init__(
-            *args,
-            size_policy=size_policy,
-            **kwargs
+        super().__init__(*args, **kwargs)
+
+        self.selection_signal = TCoalescedSignal(
+            self.selectionChanged.emit,
+            debounce=debounce,
+            parent=self
         )
 
-        self.options = options
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+
+        match flex:
+            case 'v':
+                self.setFlow(QListView.Flow.TopToBottom)
+            case 'h':
+                self.setFlow(QListView.Flow.LeftToRight)
+            case _:
+                self.setFlow(QListView.Flow.LeftToRight)
+                self.setWrapping(True)
+                self.setResizeMode(QListView.ResizeMode.Adjust)
+
+        self.option_model = TOptionModel(
+            options,
+            exclusive=self.exclusive,
+            parent=self
+        )
+        self.setModel(self.option_model)
+
         if default:
             self.value = default
+        self.selection_signal.cancel()
 
 
     @property
     def options(self):
-        return [option.text() for option in self._children]
+        return self.option_model.options
 
 
     @options.setter
     def options(self, options: list[str]):
-        selection = self.value
-        self.clear_widgets()
-        self.populate(
-            TCheckBox,
-            [{'text': option} for option in options]
-        )
-        self.value = selection
-        
+        self.option_model.options = options
+
+
+class TRadioList(TOptionView):
+    selectionChanged = Signal(str)
+    exclusive = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.option_model.checkedChanged.connect(self.update_value)
 
 
     @property
     def value(self):
-        return [
-            option.text for option in self._children
-            if option.isChecked()
-        ]
+        checked = self.option_model.checked
+        if checked:
+            return checked[0]
+
+
+    @value.setter
+    def value(self, value):
+        if value in self.option_model:
+            self.option_model.checked = [value]
+
+
+    def update_value(self):
+        value = self.value
+        if value is not None:
+            self.selection_signal.emit(value)
+
+
+class TCheckBoxList(TOptionView):
+    selectionChanged = Signal(list)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.option_model.checkedChanged.connect(self.update_value)
+
+
+    @property
+    def value(self):
+        return self.option_model.checked
+
 
     @value.setter
     def value(self, values):
-        for value in values:
-            if value in self.options:
-                for option in self._children:
-                    if option.text() == value:
-                        option.setChecked(True)
- 
+        self.option_model.checked = values
+
+
+    def set_values(self, values):
+        self.value = values
+
+
+    def update_value(self):
+        self.selection_signal.emit(self.value)